@@ -6,14 +6,42 @@ import datetime as _dt
 import json
 import os
 import sys
-from collections import Counter
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Mapping
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator.
+    _json_loads = json.loads
+else:
+    _json_loads = orjson.loads
+
 _DEFAULT_METRICS_DIR = "agent-metrics"
 _DEFAULT_OUTPUT = "agent-metrics-summary.md"
 
+# Ordered (category, substrings) checks applied to explicit type labels.
+_CATEGORY_MARKERS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("keepalive", ("keepalive",)),
+    ("autofix", ("autofix",)),
+    ("verifier", ("verifier", "verify")),
+)
+# Exact labels resolve with a single dict lookup before the substring scan.
+_CATEGORY_NAMES: dict[str, str] = {
+    "keepalive": "keepalive",
+    "autofix": "autofix",
+    "verifier": "verifier",
+    "verify": "verifier",
+}
+# Ordered (category, fields) presence checks for entries without a type label.
+_CATEGORY_FIELDS: tuple[tuple[str, frozenset[str]], ...] = (
+    ("keepalive", frozenset({"iteration_count", "stop_reason", "tasks_total"})),
+    ("autofix", frozenset({"attempt_number", "trigger_reason", "fix_applied"})),
+    ("verifier", frozenset({"verdict", "issues_created", "acceptance_criteria_count"})),
+)
+
 
 def _parse_timestamp(value: Any) -> _dt.datetime | None:
     if value is None:
@@ -54,17 +82,18 @@ def _read_ndjson(files: Iterable[Path]) -> tuple[list[dict[str, Any]], int]:
     errors = 0
     for path in files:
         try:
-            content = path.read_text(encoding="utf-8")
+            content = path.read_bytes()
         except OSError:
             errors += 1
             continue
+        # Both decoders accept UTF-8 bytes directly, so skip decoding the whole file.
         for line in content.splitlines():
             raw = line.strip()
             if not raw:
                 continue
             try:
-                parsed = json.loads(raw)
-            except json.JSONDecodeError:
+                parsed = _json_loads(raw)
+            except ValueError:
                 errors += 1
                 continue
             if isinstance(parsed, dict):
@@ -78,18 +107,15 @@ def _classify_entry(entry: dict[str, Any]) -> str:
     explicit = entry.get("metric_type") or entry.get("type") or entry.get("workflow")
     if isinstance(explicit, str):
         lowered = explicit.lower()
-        if "keepalive" in lowered:
-            return "keepalive"
-        if "autofix" in lowered:
-            return "autofix"
-        if "verifier" in lowered or "verify" in lowered:
-            return "verifier"
-    if any(key in entry for key in ("iteration_count", "stop_reason", "tasks_total")):
-        return "keepalive"
-    if any(key in entry for key in ("attempt_number", "trigger_reason", "fix_applied")):
-        return "autofix"
-    if any(key in entry for key in ("verdict", "issues_created", "acceptance_criteria_count")):
-        return "verifier"
+        exact = _CATEGORY_NAMES.get(lowered)
+        if exact is not None:
+            return exact
+        for category, markers in _CATEGORY_MARKERS:
+            if any(marker in lowered for marker in markers):
+                return category
+    for category, fields in _CATEGORY_FIELDS:
+        if not fields.isdisjoint(entry.keys()):
+            return category
     return "unknown"
 
 
@@ -112,18 +138,20 @@ def _safe_int(value: Any) -> int | None:
 
 
 def _summarise_keepalive(entries: list[dict[str, Any]]) -> dict[str, Any]:
-    stop_reasons = Counter()
-    gate_results = Counter()
+    stop_reasons: dict[str, int] = {}
+    gate_results: dict[str, int] = {}
     iterations: list[int] = []
     prs: set[int] = set()
     tasks_complete = 0
     for entry in entries:
         stop_reason = entry.get("stop_reason")
         if stop_reason:
-            stop_reasons[str(stop_reason)] += 1
+            key = str(stop_reason)
+            stop_reasons[key] = stop_reasons.get(key, 0) + 1
         gate = entry.get("gate_conclusion") or entry.get("gate_result")
         if gate:
-            gate_results[str(gate)] += 1
+            key = str(gate)
+            gate_results[key] = gate_results.get(key, 0) + 1
         iteration = _safe_int(entry.get("iteration_count") or entry.get("iteration"))
         if iteration is not None:
             iterations.append(iteration)
@@ -144,17 +172,19 @@ def _summarise_keepalive(entries: list[dict[str, Any]]) -> dict[str, Any]:
 
 
 def _summarise_autofix(entries: list[dict[str, Any]]) -> dict[str, Any]:
-    triggers = Counter()
-    gate_results = Counter()
+    triggers: dict[str, int] = {}
+    gate_results: dict[str, int] = {}
     prs: set[int] = set()
     fixes_applied = 0
     for entry in entries:
         trigger = entry.get("trigger_reason")
         if trigger:
-            triggers[str(trigger)] += 1
+            key = str(trigger)
+            triggers[key] = triggers.get(key, 0) + 1
         gate = entry.get("gate_result_after") or entry.get("gate_result")
         if gate:
-            gate_results[str(gate)] += 1
+            key = str(gate)
+            gate_results[key] = gate_results.get(key, 0) + 1
         pr_number = _safe_int(entry.get("pr_number") or entry.get("pr"))
         if pr_number is not None:
             prs.add(pr_number)
@@ -170,14 +200,15 @@ def _summarise_autofix(entries: list[dict[str, Any]]) -> dict[str, Any]:
 
 
 def _summarise_verifier(entries: list[dict[str, Any]]) -> dict[str, Any]:
-    verdicts = Counter()
+    verdicts: dict[str, int] = {}
     prs: set[int] = set()
     issues_created = 0
     acceptance_counts: list[int] = []
     for entry in entries:
         verdict = entry.get("verdict")
         if verdict:
-            verdicts[str(verdict)] += 1
+            key = str(verdict)
+            verdicts[key] = verdicts.get(key, 0) + 1
         pr_number = _safe_int(entry.get("pr_number") or entry.get("pr"))
         if pr_number is not None:
             prs.add(pr_number)
@@ -197,10 +228,11 @@ def _summarise_verifier(entries: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
-def _format_counter(counter: Counter[str]) -> str:
+def _format_counter(counter: Mapping[str, int]) -> str:
     if not counter:
         return "n/a"
-    parts = [f"{key} ({count})" for key, count in counter.most_common()]
+    ranked = sorted(counter.items(), key=itemgetter(1), reverse=True)
+    parts = [f"{key} ({count})" for key, count in ranked]
     return ", ".join(parts)
 
 
@@ -32,6 +32,12 @@ import os
 import re
 import sys
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator.
+    orjson = None  # type: ignore[assignment]
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -40,6 +46,13 @@ from tools.codex_session_analyzer import AnalysisResult, analyze_session
 
 logger = logging.getLogger(__name__)
 
+# Pattern: - [ ] or - [x] followed by task text
+CHECKBOX_PATTERN = re.compile(r"^[\s]*-\s*\[([ xX])\]\s*(.+)$", re.MULTILINE)
+# Unchecked boxes only, split so the box can be ticked without touching the text
+UNCHECKED_PATTERN = re.compile(
+    r"^(?P<lead>[^\S\n]*-[^\S\n]*)\[ \](?P<gap>[^\S\n]*)(?P<text>.*)$", re.MULTILINE
+)
+
 
 def extract_tasks_from_pr_body(pr_body: str) -> list[str]:
     """
@@ -54,10 +67,7 @@ def extract_tasks_from_pr_body(pr_body: str) -> list[str]:
     tasks = []
 
     # Match both checked and unchecked boxes to get all tasks
-    # Pattern: - [ ] or - [x] followed by task text
-    checkbox_pattern = re.compile(r"^[\s]*-\s*\[([ xX])\]\s*(.+)$", re.MULTILINE)
-
-    for match in checkbox_pattern.finditer(pr_body):
+    for match in CHECKBOX_PATTERN.finditer(pr_body):
         checked = match.group(1).lower() == "x"
         task_text = match.group(2).strip()
 
@@ -76,9 +86,7 @@ def extract_all_tasks_from_pr_body(pr_body: str) -> dict[str, bool]:
         Dict mapping task text to checked status
     """
     tasks = {}
-    checkbox_pattern = re.compile(r"^[\s]*-\s*\[([ xX])\]\s*(.+)$", re.MULTILINE)
-
-    for match in checkbox_pattern.finditer(pr_body):
+    for match in CHECKBOX_PATTERN.finditer(pr_body):
         checked = match.group(1).lower() == "x"
         task_text = match.group(2).strip()
         if task_text:
@@ -98,22 +106,19 @@ def update_pr_body_checkboxes(pr_body: str, completed_tasks: list[str]) -> str:
     Returns:
         Updated PR body with checkboxes updated
     """
-    updated_body = pr_body
-
-    for task in completed_tasks:
-        # Escape special regex characters in task
-        escaped_task = re.escape(task)
-
-        # Pattern to match unchecked checkbox with this task
-        pattern = re.compile(
-            rf"^([\s]*-\s*)\[ \](\s*){escaped_task}",
-            re.MULTILINE,
-        )
+    completed = {task for task in completed_tasks if task}
+    if not completed:
+        return pr_body
+    prefixes = tuple(completed)
 
-        # Replace with checked version
-        updated_body = pattern.sub(rf"\1[x]\2{task}", updated_body)
+    def _check(match: re.Match[str]) -> str:
+        text = match.group("text")
+        # Exact task text is the common case; keep prefix matching as a fallback.
+        if text.rstrip() in completed or text.startswith(prefixes):
+            return f"{match.group('lead')}[x]{match.group('gap')}{text}"
+        return match.group(0)
 
-    return updated_body
+    return UNCHECKED_PATTERN.sub(_check, pr_body)
 
 
 def output_github_actions(result: AnalysisResult) -> None:
@@ -166,6 +171,16 @@ def output_github_actions(result: AnalysisResult) -> None:
             f.write(f"completed-tasks={completed_json}\n")
 
 
+def _dumps_json(data: dict[str, Any], *, pretty: bool = False) -> str:
+    """Serialise ``data`` with orjson when installed, else the stdlib encoder."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(data, option=option).decode("utf-8")
+    if pretty:
+        return json.dumps(data, indent=2)
+    return json.dumps(data)
+
+
 def output_json(result: AnalysisResult, pretty: bool = False) -> None:
     """Output results as JSON."""
     data = {
@@ -199,10 +214,7 @@ def output_json(result: AnalysisResult, pretty: bool = False) -> None:
             "todo_count": len(result.session.todo_items),
         }
 
-    if pretty:
-        print(json.dumps(data, indent=2))
-    else:
-        print(json.dumps(data))
+    print(_dumps_json(data, pretty=pretty))
 
 
 def output_markdown(result: AnalysisResult) -> None:
@@ -210,7 +222,7 @@ def output_markdown(result: AnalysisResult) -> None:
     print(result.get_summary())
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Analyze Codex session output for task completion",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -275,7 +287,7 @@ def main() -> int:
         help="Force use of a specific LLM provider (for testing)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Setup logging to stderr (stdout is reserved for JSON output)
     logging.basicConfig(
@@ -28,6 +28,7 @@ import os
 import re
 import sys
 from collections.abc import Iterator
+from functools import cache
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
@@ -55,9 +56,12 @@ def _load_allowlist() -> list[str]:
 ALLOWLIST = _load_allowlist()
 DRY_RUN = os.environ.get("AUTO_TYPE_DRY_RUN") == "1"
 
-IMPORT_PATTERN = re.compile(
-    r"^(?P<indent>\s*)(import|from)\s+(?P<module>[a-zA-Z0-9_\.]+)(?P<rest>.*)$"
+# Matches import lines across a whole file so it can be scanned in one pass.
+IMPORT_LINE_PATTERN = re.compile(
+    r"^(?P<indent>[^\S\n]*)(import|from)[^\S\n]+(?P<module>[a-zA-Z0-9_\.]+)(?P<rest>.*)$",
+    re.MULTILINE,
 )
+IGNORE_COMMENT_PATTERN = re.compile(r"#\s*type:\s*ignore(?P<bracket>\[[^\]]*\])?")
 IGNORE_CODES: tuple[str, ...] = ("import-untyped", "unused-ignore")
 IGNORE_TOKEN = f"# type: ignore[{', '.join(IGNORE_CODES)}]"
 
@@ -67,6 +71,7 @@ def should_exclude(path: Path) -> bool:
     return any(p.search(rel) for p in EXCLUDE_PATTERNS)
 
 
+@cache
 def _has_stub_package(module: str) -> bool:
     base = module.split(".")[0]
     stub_dirname = f"{base}-stubs"
@@ -85,8 +90,14 @@ def _has_stub_package(module: str) -> bool:
     return False
 
 
+@cache
 def module_has_types(module: str) -> bool:
-    """Return ``True`` if ``module`` has typing support available."""
+    """Return ``True`` if ``module`` has typing support available.
+
+    Results are memoised for the lifetime of the process because ``SRC_DIRS``
+    and ``sys.path`` do not change during a run; call ``cache_clear()`` after
+    patching either.
+    """
 
     if module.split(".")[0] in TYPED_FALLBACK:
         return True
@@ -126,70 +137,72 @@ def needs_ignore(module: str) -> bool:
     return base in ALLOWLIST and not module_has_types(module)
 
 
+def _apply_ignore(line: str) -> str:
+    """Return ``line`` with the ignore token added or merged (unchanged if present)."""
+    if IGNORE_TOKEN in line:
+        return line
+
+    ignore_match = IGNORE_COMMENT_PATTERN.search(line)
+    if not ignore_match:
+        return f"{line.rstrip()}  {IGNORE_TOKEN}"
+
+    bracket = ignore_match.group("bracket")
+    if bracket is None:
+        replacement = IGNORE_TOKEN
+    else:
+        bracket_content = bracket[1:-1].strip()
+        if bracket_content:
+            codes = [code.strip() for code in bracket_content.split(",") if code.strip()]
+        else:
+            codes = []
+        codes_set = set(codes)
+        if codes_set.issuperset(IGNORE_CODES):
+            return line
+        merged = list(codes)
+        for code in IGNORE_CODES:
+            if code not in codes_set:
+                merged.append(code)
+        replacement = f"# type: ignore[{', '.join(merged)}]"
+
+    start, end = ignore_match.span()
+    return f"{line[:start]}{replacement}{line[end:]}"
+
+
 def process_file(path: Path) -> tuple[bool, list[str]]:
     """Return (changed, new_lines)."""
     try:
-        original = path.read_text(encoding="utf-8").splitlines()
+        text = path.read_text(encoding="utf-8")
     except Exception:
         return False, []
 
     changed = False
-    new_lines: list[str] = []
 
-    for line in original:
-        m = IMPORT_PATTERN.match(line)
-        if not m:
-            new_lines.append(line)
-            continue
-        module = m.group("module")
-        if needs_ignore(module):
-            target_codes = set(IGNORE_CODES)
-            if IGNORE_TOKEN in line:
-                new_lines.append(line)
-                continue
-
-            ignore_match = re.search(r"#\s*type:\s*ignore(?P<bracket>\[[^\]]*\])?", line)
-            if ignore_match:
-                bracket = ignore_match.group("bracket")
-                if bracket is None:
-                    replacement = IGNORE_TOKEN
-                else:
-                    bracket_content = bracket[1:-1].strip()
-                    if bracket_content:
-                        codes = [
-                            code.strip() for code in bracket_content.split(",") if code.strip()
-                        ]
-                    else:
-                        codes = []
-                    codes_set = set(codes)
-                    if target_codes.issubset(codes_set):
-                        new_lines.append(line)
-                        continue
-                    merged = list(codes)
-                    for code in IGNORE_CODES:
-                        if code not in codes_set:
-                            merged.append(code)
-                    replacement = f"# type: ignore[{', '.join(merged)}]"
-
-                start, end = ignore_match.span()
-                line = f"{line[:start]}{replacement}{line[end:]}"
-                changed = True
-            else:
-                line = f"{line.rstrip()}  {IGNORE_TOKEN}"
-                changed = True
-        new_lines.append(line)
-
-    return changed, new_lines
+    def _rewrite(match: re.Match[str]) -> str:
+        nonlocal changed
+        line = match.group(0)
+        if not needs_ignore(match.group("module")):
+            return line
+        updated = _apply_ignore(line)
+        if updated != line:
+            changed = True
+        return updated
+
+    # One pass over the whole buffer; only import lines reach the callback.
+    new_text = IMPORT_LINE_PATTERN.sub(_rewrite, text)
+    return changed, new_text.splitlines()
 
 
 def iter_python_files() -> Iterator[Path]:
     for base in SRC_DIRS:
-        if not base.exists():
+        if not base.exists() or should_exclude(base):
             continue
-        for path in base.rglob("*.py"):
-            if should_exclude(path):
-                continue
-            yield path
+        for dirpath, dirnames, filenames in os.walk(base):
+            root = Path(dirpath)
+            # Prune excluded directories so their subtrees are never listed.
+            dirnames[:] = [name for name in dirnames if not should_exclude(root / name)]
+            for filename in filenames:
+                if filename.endswith(".py"):
+                    yield root / filename
 
 
 def main() -> int:
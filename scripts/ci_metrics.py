@@ -17,10 +17,11 @@ Phase-2 CI dashboards (see ``docs/ci-workflow.md``).
 from __future__ import annotations
 
 import datetime as _dt
+import heapq
 import json
 import os
 import sys
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -82,46 +83,54 @@ def _build_nodeid(classname: str, name: str) -> str:
     return name or classname or "(unknown)"
 
 
+def _testcase_from_element(testcase: ET.Element) -> _TestCase:
+    name = testcase.attrib.get("name", "")
+    classname = testcase.attrib.get("classname", "")
+    nodeid = _build_nodeid(classname, name)
+    try:
+        duration = float(testcase.attrib.get("time", "0") or 0.0)
+    except ValueError:
+        duration = 0.0
+
+    outcome = "passed"
+    message: str | None = None
+    err_type: str | None = None
+    details: str | None = None
+
+    for child in testcase:
+        tag = _tag_name(child).lower()
+        if tag in {"failure", "error", "skipped"}:
+            outcome = "error" if tag == "error" else tag
+            message = child.attrib.get("message") if child.attrib else None
+            err_type = child.attrib.get("type") if child.attrib else None
+            text = child.text or ""
+            details = text.strip() or None
+            # First terminal status wins – ignore subsequent system-out/in
+            break
+
+    return _TestCase(
+        name=name,
+        classname=classname,
+        nodeid=nodeid,
+        time=duration,
+        outcome=outcome,
+        message=message,
+        error_type=err_type,
+        details=details,
+    )
+
+
 def _extract_testcases(root: ET.Element) -> list[_TestCase]:
-    cases: list[_TestCase] = []
-    for testcase in root.findall(".//testcase"):
-        name = testcase.attrib.get("name", "")
-        classname = testcase.attrib.get("classname", "")
-        nodeid = _build_nodeid(classname, name)
-        try:
-            duration = float(testcase.attrib.get("time", "0") or 0.0)
-        except ValueError:
-            duration = 0.0
-
-        outcome = "passed"
-        message: str | None = None
-        err_type: str | None = None
-        details: str | None = None
-
-        for child in testcase:
-            tag = _tag_name(child).lower()
-            if tag in {"failure", "error", "skipped"}:
-                outcome = "error" if tag == "error" else tag
-                message = child.attrib.get("message") if child.attrib else None
-                err_type = child.attrib.get("type") if child.attrib else None
-                text = child.text or ""
-                details = text.strip() or None
-                # First terminal status wins – ignore subsequent system-out/in
-                break
-
-        cases.append(
-            _TestCase(
-                name=name,
-                classname=classname,
-                nodeid=nodeid,
-                time=duration,
-                outcome=outcome,
-                message=message,
-                error_type=err_type,
-                details=details,
-            )
-        )
-    return cases
+    return [_testcase_from_element(testcase) for testcase in root.findall(".//testcase")]
+
+
+def _iter_testcases(junit_path: Path) -> Iterator[_TestCase]:
+    """Stream test cases from ``junit_path`` without keeping the whole tree."""
+    for _event, element in ET.iterparse(junit_path, events=("end",)):
+        if element.tag == "testcase":
+            yield _testcase_from_element(element)
+            # Drop the consumed subtree (captured output can be large).
+            element.clear()
 
 
 def _summarise(cases: Sequence[_TestCase]) -> dict[str, Any]:
@@ -169,9 +178,8 @@ def _collect_slow_tests(
 ) -> list[dict[str, Any]]:
     if not cases or top_n == 0:
         return []
-    eligible = [c for c in cases if c.time >= min_seconds]
-    eligible.sort(key=lambda c: (-c.time, c.nodeid))
-    subset = eligible[:top_n]
+    eligible = (c for c in cases if c.time >= min_seconds)
+    subset = heapq.nsmallest(top_n, eligible, key=lambda c: (-c.time, c.nodeid))
     return [
         {
             "name": c.name,
@@ -194,11 +202,10 @@ def build_metrics(
         raise FileNotFoundError(f"JUnit report not found: {junit_path}")
 
     try:
-        root = ET.parse(junit_path).getroot()
+        cases = list(_iter_testcases(junit_path))
     except ET.ParseError as exc:  # pragma: no cover - JUnit corruption is unlikely
         raise SystemExit(f"Failed to parse JUnit XML {junit_path}: {exc}") from exc
 
-    cases = _extract_testcases(root)
     summary = _summarise(cases)
     failures = _collect_failures(cases)
     slow_tests = _collect_slow_tests(cases, top_n=top_n, min_seconds=min_seconds)
@@ -19,23 +19,35 @@ library so it runs inside GitHub Actions without extra dependencies.
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import re
 import sys
 import xml.etree.ElementTree as ET
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
-_MARKER_KEYS = {
-    "test_markers",
-    "markers",
-    "pytest_markers",
-    "pytestmark",
-}
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator.
+    orjson = None  # type: ignore[assignment]
+
+_MARKER_KEYS = frozenset(
+    {
+        "test_markers",
+        "markers",
+        "pytest_markers",
+        "pytestmark",
+    }
+)
 
 _MARKER_SPLIT_RE = re.compile(r"[\s,]+")
 
+# Child tags marking a failing test case, in precedence order; the tag doubles
+# as the record's ``failure_type``.
+_FAILURE_TAGS = ("failure", "error")
+
 
 @dataclass(frozen=True)
 class FailureRecord:
@@ -83,34 +95,65 @@ def _extract_markers(testcase: ET.Element) -> set[str]:
             continue
         lowered = name.lower()
         if lowered in _MARKER_KEYS:
-            markers.update(token for token in _MARKER_SPLIT_RE.split(value) if token)
+            markers.update(sys.intern(token) for token in _MARKER_SPLIT_RE.split(value) if token)
         elif lowered.startswith("marker:"):
-            markers.add(lowered.split(":", 1)[1])
+            markers.add(sys.intern(lowered.split(":", 1)[1]))
     return markers
 
 
-def _failure_message(testcase: ET.Element) -> tuple[str, str]:
-    for tag, failure_type in (("failure", "failure"), ("error", "error")):
+def _find_failure(testcase: ET.Element) -> ET.Element | None:
+    for tag in _FAILURE_TAGS:
         node = testcase.find(tag)
         if node is not None:
-            message = node.get("message") or ""
-            text = (node.text or "").strip()
-            if text and message:
-                message = f"{message}: {text}"
-            elif text:
-                message = text
-            return message, failure_type
-    return "", "failure"
+            return node
+    return None
+
+
+def _describe_failure(node: ET.Element) -> tuple[str, str]:
+    message = node.get("message") or ""
+    text = (node.text or "").strip()
+    if text and message:
+        message = f"{message}: {text}"
+    elif text:
+        message = text
+    return message, node.tag
+
+
+def _failure_message(testcase: ET.Element) -> tuple[str, str]:
+    node = _find_failure(testcase)
+    if node is None:
+        return "", "failure"
+    return _describe_failure(node)
+
 
+def _test_id(testcase: ET.Element, source: Path | str) -> str:
+    """Return ``classname::name`` for a test case.
 
-def _test_id(testcase: ET.Element, source: Path) -> str:
+    ``source`` may be the report path or its precomputed file name; the name is
+    only used when the test case carries no ``name`` attribute.
+    """
     classname = testcase.get("classname") or ""
     name = testcase.get("name") or ""
     if classname and name:
         return f"{classname}::{name}"
     if name:
         return name
-    return f"{source.name}::{testcase.tag}"
+    source_name = source if isinstance(source, str) else source.name
+    return f"{source_name}::{testcase.tag}"
+
+
+def _iter_testcases(data: bytes) -> Iterator[ET.Element]:
+    """Yield ``<testcase>`` elements as they close, freeing each one afterwards.
+
+    Streaming keeps the element tree bounded by a single test case even when
+    reports carry megabytes of captured ``system-out``.  The report is read by
+    the caller in one call, so the parser consumes an in-memory buffer rather
+    than opening its own buffered file.
+    """
+    for _event, element in ET.iterparse(io.BytesIO(data), events=("end",)):
+        if element.tag == "testcase":
+            yield element
+            element.clear()
 
 
 def classify_reports(paths: Iterable[str | Path]) -> dict[str, object]:
@@ -121,43 +164,47 @@ def classify_reports(paths: Iterable[str | Path]) -> dict[str, object]:
 
     for path in sorted({str(Path(p)) for p in paths}):
         junit_path = Path(path)
-        if not junit_path.exists():
+        report_name = junit_path.name
+        try:
+            data = junit_path.read_bytes()
+        except FileNotFoundError:
             continue
+        # Buffer per report so a truncated file contributes only its parse error.
+        report_records: list[tuple[FailureRecord, set[str]]] = []
+        report_ids: set[tuple[str, str]] = set()
         try:
-            tree = ET.parse(junit_path)
+            for testcase in _iter_testcases(data):
+                failure_node = _find_failure(testcase)
+                if failure_node is None:
+                    continue
+                case_id = _test_id(testcase, report_name)
+                dedupe_key = (case_id, path)
+                if dedupe_key in seen_ids or dedupe_key in report_ids:
+                    continue
+                report_ids.add(dedupe_key)
+                marker_set = _extract_markers(testcase)
+                message, failure_type = _describe_failure(failure_node)
+                record = FailureRecord(
+                    id=case_id,
+                    file=path,
+                    markers=tuple(sorted(marker_set)),
+                    message=message,
+                    failure_type=failure_type,
+                )
+                report_records.append((record, marker_set))
         except ET.ParseError as exc:
             unknown.append(
                 FailureRecord(
-                    id=f"<parse-error>:{junit_path.name}",
-                    file=str(junit_path),
+                    id=f"<parse-error>:{report_name}",
+                    file=path,
                     markers=(),
                     message=f"Unable to parse JUnit XML: {exc}",
                     failure_type="error",
                 )
             )
             continue
-        root = tree.getroot()
-        testcases = list(root.iter("testcase"))
-        for testcase in testcases:
-            failure_node = testcase.find("failure")
-            if failure_node is None:
-                failure_node = testcase.find("error")
-            if failure_node is None:
-                continue
-            marker_set = _extract_markers(testcase)
-            case_id = _test_id(testcase, junit_path)
-            dedupe_key = (case_id, str(junit_path))
-            if dedupe_key in seen_ids:
-                continue
-            seen_ids.add(dedupe_key)
-            message, failure_type = _failure_message(testcase)
-            record = FailureRecord(
-                id=case_id,
-                file=str(junit_path),
-                markers=tuple(sorted(marker_set)),
-                message=message,
-                failure_type=failure_type,
-            )
+        seen_ids.update(report_ids)
+        for record, marker_set in report_records:
             if "runtime" in marker_set:
                 runtime.append(record)
             elif "cosmetic" in marker_set:
@@ -172,6 +219,13 @@ def classify_reports(paths: Iterable[str | Path]) -> dict[str, object]:
     return summary.as_dict()
 
 
+def _dumps_summary(summary: dict[str, object]) -> bytes:
+    """Serialise ``summary`` as indented, key-sorted JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(summary, indent=2, sort_keys=True).encode("utf-8")
+
+
 def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -198,10 +252,17 @@ def main(argv: Sequence[str] | None = None) -> int:
         else:
             expanded.append(pattern)
     summary = classify_reports(expanded)
-    payload = json.dumps(summary, indent=2, sort_keys=True)
+    payload = _dumps_summary(summary) + b"\n"
     if ns.output:
-        ns.output.write_text(payload + "\n", encoding="utf-8")
-    print(payload)
+        ns.output.write_bytes(payload)
+    stdout_buffer = getattr(sys.stdout, "buffer", None)
+    if stdout_buffer is None:
+        # Text-only streams (e.g. ``contextlib.redirect_stdout``) lack ``buffer``.
+        sys.stdout.write(payload.decode("utf-8"))
+    else:
+        sys.stdout.flush()
+        stdout_buffer.write(payload)
+        stdout_buffer.flush()
     return 0
 
 
@@ -21,14 +21,15 @@ def load_existing(path: Path) -> list[JsonRecord]:
     if not path.exists():
         return []
     records: list[JsonRecord] = []
-    with path.open("r", encoding="utf-8") as fh:
+    # json.loads accepts UTF-8 bytes, so no text layer is needed.
+    with path.open("rb") as fh:
         for line in fh:
             line = line.strip()
             if not line:
                 continue
             try:
                 records.append(json.loads(line))
-            except json.JSONDecodeError:
+            except ValueError:
                 # Skip corrupt lines but keep file usable
                 continue
     return records
@@ -41,7 +42,7 @@ def main() -> int:
         print(f"[history] record file missing: {record_path}", file=sys.stderr)
         return 0
     try:
-        record_obj = json.loads(record_path.read_text(encoding="utf-8"))
+        record_obj = json.loads(record_path.read_bytes())
     except Exception as e:
         print(f"[history] failed to parse record: {e}", file=sys.stderr)
         return 0
@@ -63,10 +64,10 @@ def main() -> int:
         return r.get("run_id", 0)
 
     existing.sort(key=sort_key)
+    # Same line format as before (default separators) so rewrites do not churn history.
+    payload = "".join(json.dumps(r, sort_keys=True) + "\n" for r in existing).encode("utf-8")
     tmp = history_path.with_suffix(".tmp")
-    with tmp.open("w", encoding="utf-8") as out:
-        for r in existing:
-            out.write(json.dumps(r, sort_keys=True) + "\n")
+    tmp.write_bytes(payload)
     tmp.replace(history_path)
     print(f"[history] appended coverage record run_id={run_id} -> {history_path}")
     return 0
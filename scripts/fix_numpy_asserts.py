@@ -9,38 +9,40 @@ ROOT = Path(".")
 TEST_ROOT = Path("tests")
 TARGET_FILES: set[Path] = set()
 
+ARRAY_ASSIGN_PATTERN = re.compile(r"^[^\S\n]*(\w+)[^\S\n]*=[^\S\n]*np\.array", re.MULTILINE)
+# ``assert name == [...]`` on its own line; anything after the closing bracket
+# (such as a trailing comment) is dropped when the line is rewritten.
+ASSERT_EQ_PATTERN = re.compile(
+    r"^([^\S\n]*)assert [^\S\n]*(\w+)[^\S\n]*==[^\S\n]*(\[.*\])[^\r\n]*", re.MULTILINE
+)
+
+
+def _tracked_arrays_in_text(text: str) -> set[str]:
+    return set(ARRAY_ASSIGN_PATTERN.findall(text))
+
 
 def _tracked_arrays(lines: list[str]) -> set[str]:
-    names: set[str] = set()
-    pattern = re.compile(r"^\s*(\w+)\s*=\s*np\.array")
-    for line in lines:
-        match = pattern.match(line)
-        if match:
-            names.add(match.group(1))
-    return names
+    return _tracked_arrays_in_text("\n".join(lines))
 
 
 def process_file(path: Path) -> bool:
-    lines = path.read_text(encoding="utf-8").splitlines()
-    array_vars = _tracked_arrays(lines)
-    changed = False
-    new_lines: list[str] = []
-
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("assert ") and "==" in stripped and ".tolist()" not in stripped:
-            match = re.match(r"\s*assert\s+(\w+)\s*==\s*(\[.*\])", stripped)
-            if match:
-                var_name = match.group(1)
-                if var_name in array_vars:
-                    prefix = line.split("assert", 1)[0]
-                    line = f"{prefix}assert {var_name}.tolist() == {match.group(2)}"
-                    changed = True
-        new_lines.append(line)
-
-    if changed:
-        path.write_text("\n".join(new_lines), encoding="utf-8")
-    return changed
+    text = path.read_bytes().decode("utf-8")
+    array_vars = _tracked_arrays_in_text(text)
+    if not array_vars:
+        return False
+
+    def _rewrite(match: re.Match[str]) -> str:
+        line = match.group(0)
+        var_name = match.group(2)
+        if var_name not in array_vars or ".tolist()" in line:
+            return line
+        return f"{match.group(1)}assert {var_name}.tolist() == {match.group(3)}"
+
+    new_text = ASSERT_EQ_PATTERN.sub(_rewrite, text)
+    if new_text == text:
+        return False
+    path.write_bytes(new_text.encode("utf-8"))
+    return True
 
 
 def main() -> int:
@@ -40,16 +40,13 @@ def sparkline(series: list[int]) -> str:
     if mx == mn:
         return SPARK_CHARS[0] * len(series)
     span = mx - mn
-    out = []
-    for v in series:
-        idx = int((v - mn) / span * (len(SPARK_CHARS) - 1))
-        out.append(SPARK_CHARS[idx])
-    return "".join(out)
+    top = len(SPARK_CHARS) - 1
+    return "".join(SPARK_CHARS[int((v - mn) / span * top)] for v in series)
 
 
 def main() -> int:
     try:
-        hist_raw = json.loads(HISTORY.read_text())
+        hist_raw = json.loads(HISTORY.read_bytes())
     except Exception:
         hist_raw = []
     hist: list[dict[str, object]]
@@ -89,7 +86,7 @@ def main() -> int:
         "codes": code_sparklines,
     }
     OUT.parent.mkdir(parents=True, exist_ok=True)
-    OUT.write_text(json.dumps(trend, indent=2, sort_keys=True))
+    OUT.write_bytes(json.dumps(trend, indent=2, sort_keys=True).encode("utf-8"))
     print(
         f"trend remaining={trend['remaining_latest']} new={trend['new_latest']} {trend['remaining_spark']} / {trend['new_spark']}"
     )
@@ -5,13 +5,19 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
-from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator.
+    orjson = None  # type: ignore[assignment]
+
 REQUIRED_FIELDS = (
     "pr_number",
     "iteration",
@@ -23,6 +29,14 @@ REQUIRED_FIELDS = (
     "tasks_complete",
 )
 
+INT_FIELDS = (
+    "pr_number",
+    "iteration",
+    "duration_ms",
+    "tasks_total",
+    "tasks_complete",
+)
+
 
 @dataclass(frozen=True)
 class ValidationError(Exception):
@@ -41,6 +55,12 @@ def _is_int(value: Any) -> bool:
 def _parse_timestamp(value: str) -> datetime:
     if not value:
         raise ValidationError("timestamp is required")
+    return _parse_timestamp_cached(value)
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp_cached(value: str) -> datetime:
+    # Batches of records often share timestamps; invalid values raise and are not cached.
     raw = value.strip()
     if raw.endswith("Z"):
         raw = raw[:-1] + "+00:00"
@@ -89,16 +109,11 @@ def _coerce_int(value: str, field: str) -> int:
 
 
 def build_record_from_args(args: argparse.Namespace) -> dict[str, Any]:
-    record = {
-        "pr_number": _coerce_int(args.pr_number, "pr_number"),
-        "iteration": _coerce_int(args.iteration, "iteration"),
-        "timestamp": args.timestamp or _utc_now_iso(),
-        "action": args.action,
-        "error_category": args.error_category,
-        "duration_ms": _coerce_int(args.duration_ms, "duration_ms"),
-        "tasks_total": _coerce_int(args.tasks_total, "tasks_total"),
-        "tasks_complete": _coerce_int(args.tasks_complete, "tasks_complete"),
-    }
+    values = vars(args)
+    record: dict[str, Any] = {field: _coerce_int(values[field], field) for field in INT_FIELDS}
+    record["timestamp"] = args.timestamp or _utc_now_iso()
+    record["action"] = args.action
+    record["error_category"] = args.error_category
     return record
 
 
@@ -114,18 +129,28 @@ def load_record_from_json(payload: str) -> dict[str, Any]:
     return record
 
 
+def _encode_line(record: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, separators=(",", ":"), sort_keys=True) + "\n").encode("utf-8")
+
+
 def append_record(path: Path, record: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    payload = json.dumps(record, separators=(",", ":"), sort_keys=True)
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(payload + "\n")
+    payload = memoryview(_encode_line(record))
+    # One O_APPEND write per record keeps concurrent appenders from interleaving.
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        while payload:
+            written = os.write(fd, payload)
+            payload = payload[written:]
+    finally:
+        os.close(fd)
 
 
-def _iter_errors(error: Exception) -> Iterable[str]:
-    if isinstance(error, ValidationError):
-        yield str(error)
-    else:
-        yield str(error)
+def _iter_errors(error: Exception) -> list[str]:
+    # ValidationError and unexpected exceptions both carry a single message.
+    return [str(error)]
 
 
 def build_parser() -> argparse.ArgumentParser:
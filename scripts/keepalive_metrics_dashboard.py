@@ -5,11 +5,25 @@ from __future__ import annotations
 
 import argparse
 import json
+import mmap
+import os
 import sys
-from collections import Counter
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator.
+    _json_loads = json.loads
+else:
+    _json_loads = orjson.loads
+
+# Logs at least this large are scanned through a read-only memory map rather
+# than being read into memory whole.
+MMAP_THRESHOLD = 1 << 20
 
 
 def _safe_int(value: Any) -> int | None:
@@ -21,33 +35,43 @@ def _safe_int(value: Any) -> int | None:
         return None
 
 
+def _iter_lines(handle: BinaryIO) -> Iterator[bytes]:
+    if os.fstat(handle.fileno()).st_size < MMAP_THRESHOLD:
+        yield from handle.read().splitlines()
+        return
+    with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        yield from iter(view.readline, b"")
+
+
 def _read_ndjson(path: Path) -> tuple[list[dict[str, Any]], int]:
     entries: list[dict[str, Any]] = []
     errors = 0
     try:
-        content = path.read_text(encoding="utf-8")
+        handle = path.open("rb")
     except OSError:
         return entries, 1
-    for line in content.splitlines():
-        raw = line.strip()
-        if not raw:
-            continue
-        try:
-            parsed = json.loads(raw)
-        except json.JSONDecodeError:
-            errors += 1
-            continue
-        if isinstance(parsed, dict):
-            entries.append(parsed)
-        else:
-            errors += 1
+    with handle:
+        for line in _iter_lines(handle):
+            raw = line.strip()
+            if not raw:
+                continue
+            try:
+                parsed = _json_loads(raw)
+            except ValueError:
+                errors += 1
+                continue
+            if isinstance(parsed, dict):
+                entries.append(parsed)
+            else:
+                errors += 1
     return entries, errors
 
 
-def _format_counter(counter: Counter[str]) -> str:
+def _format_counter(counter: Mapping[str, int]) -> str:
     if not counter:
         return "n/a"
-    return ", ".join(f"{key} ({count})" for key, count in counter.most_common())
+    ranked = sorted(counter.items(), key=itemgetter(1), reverse=True)
+    return ", ".join(f"{key} ({count})" for key, count in ranked)
 
 
 def _format_rate(numerator: int, denominator: int) -> str:
@@ -60,27 +84,34 @@ def _format_rate(numerator: int, denominator: int) -> str:
 def _summarise(records: Iterable[dict[str, Any]]) -> dict[str, Any]:
     total = 0
     successes = 0
-    error_breakdown: Counter[str] = Counter()
-    iteration_counts: Counter[str] = Counter()
+    error_breakdown: dict[str, int] = {}
+    iteration_counts: dict[str, int] = {}
     pr_iterations: dict[int, int] = {}
+    # Bound-method aliases keep the per-record loop to local lookups.
+    error_get = error_breakdown.get
+    iteration_get = iteration_counts.get
+    pr_get = pr_iterations.get
 
     for record in records:
         total += 1
-        error_category_raw = record.get("error_category")
+        record_get = record.get
+        error_category_raw = record_get("error_category")
         error_category = str(error_category_raw).strip() if error_category_raw is not None else ""
         if not error_category:
             error_category = "unknown"
         if error_category.lower() == "none":
             successes += 1
-        error_breakdown[error_category] += 1
+        error_breakdown[error_category] = error_get(error_category, 0) + 1
 
-        iteration = _safe_int(record.get("iteration"))
-        if iteration is not None:
-            iteration_counts[str(iteration)] += 1
+        iteration = _safe_int(record_get("iteration"))
+        if iteration is None:
+            continue
+        iteration_key = str(iteration)
+        iteration_counts[iteration_key] = iteration_get(iteration_key, 0) + 1
 
-        pr_number = _safe_int(record.get("pr_number"))
-        if pr_number is not None and iteration is not None:
-            pr_iterations[pr_number] = max(iteration, pr_iterations.get(pr_number, 0))
+        pr_number = _safe_int(record_get("pr_number"))
+        if pr_number is not None:
+            pr_iterations[pr_number] = max(iteration, pr_get(pr_number, 0))
 
     avg_iterations = None
     if pr_iterations:
@@ -11,10 +11,14 @@ from __future__ import annotations
 import argparse
 import datetime as _dt
 import json
+import os
 import re
 import subprocess
 import sys
+import threading
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -27,9 +31,21 @@ if SRC_ROOT.exists():  # ensure local package import works before editable insta
 
 from utils.paths import proj_path  # noqa: E402
 
-VALID_STATUSES = {"todo", "doing", "done"}
+VALID_STATUSES = frozenset({"todo", "doing", "done"})
+# Files a ledger-only commit may touch besides the ledger itself.
+LEDGER_SIDECARS = frozenset({".agents/.ledger-summary.md", ".agents/.ledger-start.json"})
+LEDGER_PREFIX = "issue-"
+LEDGER_SUFFIX = "-ledger.yml"
 HEX_RE = re.compile(r"^[0-9a-f]{7,40}$")
+# Abbreviated or full object name accepted by ``git cat-file --batch-check``.
+_OBJECT_NAME_RE = re.compile(r"^[0-9a-fA-F]{4,40}$")
 ISO8601_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+# Ledgers are validated concurrently; fetches into the one clone must not overlap.
+_FETCH_LOCK = threading.Lock()
+# Commits that could not be fetched even from the full history; guarded by _FETCH_LOCK.
+_UNFETCHABLE_COMMITS: set[str] = set()
+# libyaml-backed loader when PyYAML was built with it; same safe schema either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class LedgerError(Exception):
@@ -42,8 +58,8 @@ class LedgerError(Exception):
 
 def _load_yaml(path: Path) -> Any:
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            return yaml.safe_load(handle)
+        with path.open("rb") as handle:
+            return yaml.load(handle, Loader=_YAML_LOADER)
     except yaml.YAMLError as exc:
         raise LedgerError(f"invalid YAML: {exc}", context=str(path)) from exc
 
@@ -61,122 +77,169 @@ def _validate_timestamp(value: Any, *, field: str, path: str) -> list[str]:
     if not isinstance(value, str):
         errors.append(f"{path}.{field} must be a string or null")
         return errors
+    problem = _timestamp_problem(value)
+    if problem is not None:
+        errors.append(f"{path}.{field} {problem}")
+    return errors
+
+
+@lru_cache(maxsize=256)
+def _timestamp_problem(value: str) -> str | None:
+    """Return why *value* is not a ledger timestamp, or ``None`` when it is valid.
+
+    Ledgers repeat the same timestamps across tasks, so results are memoised.
+    """
     if not ISO8601_RE.match(value):
-        errors.append(f"{path}.{field} must be an ISO-8601 UTC timestamp (YYYY-MM-DDTHH:MM:SSZ)")
-        return errors
+        return "must be an ISO-8601 UTC timestamp (YYYY-MM-DDTHH:MM:SSZ)"
     try:
-        _dt.datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
+        # The pattern above pins the shape, so the C ISO parser only checks ranges.
+        _dt.datetime.fromisoformat(value[:-1])
     except ValueError as exc:
-        errors.append(f"{path}.{field} is not a valid timestamp: {exc}")
-    return errors
+        return f"is not a valid timestamp: {exc}"
+    return None
 
 
 def _fetch_commit(commit: str) -> bool:
     """Ensure *commit* exists locally, fetching extra history if needed."""
+    return _fetch_commits([commit])
 
-    fetch_attempts = [
-        [
-            "git",
-            "fetch",
-            "--no-tags",
-            "--filter=blob:none",
-            "origin",
-            commit,
-        ],
-        [
-            "git",
-            "fetch",
-            "--no-tags",
-            "--filter=blob:none",
-            "--deepen",
-            "256",
-            "origin",
-        ],
-        [
-            "git",
-            "fetch",
-            "--no-tags",
-            "--filter=blob:none",
-            "--unshallow",
-            "origin",
-        ],
+
+def _git_fetch(*args: str) -> bool:
+    command = ["git", "fetch", "--no-tags", "--filter=blob:none", *args]
+    try:
+        subprocess.check_call(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except subprocess.CalledProcessError:
+        return False
+    return True
+
+
+def _fetch_by_sha(commits: list[str]) -> list[str]:
+    """Fetch *commits* by SHA and return the ones that could not be fetched."""
+    if _git_fetch("origin", *commits):
+        return []
+    if len(commits) == 1:
+        return commits
+    # One unknown or garbage-collected SHA fails the whole batch, so retry
+    # individually to tell the good SHAs from the bad ones.
+    return [commit for commit in commits if not _git_fetch("origin", commit)]
+
+
+def _fetch_commits(commits: list[str]) -> bool:
+    """Fetch *commits* in one ``git fetch``, deepening the clone if needed.
+
+    Returns ``True`` only when every commit was fetched.  SHAs that still
+    cannot be fetched after the clone is unshallowed are remembered, so later
+    lookups of the same commit do not repeat the whole chain.
+    """
+    with _FETCH_LOCK:
+        remaining = [commit for commit in commits if commit not in _UNFETCHABLE_COMMITS]
+        complete = len(remaining) == len(commits)
+        if not remaining:
+            return False
+        remaining = _fetch_by_sha(remaining)
+
+        for deepen in (("--deepen", "256"), ("--unshallow",)):
+            if not remaining:
+                break
+            # Success here just deepened the local clone; try once more to pull
+            # the exact commits while the additional history is available.
+            if _git_fetch(*deepen, "origin"):
+                remaining = _fetch_by_sha(remaining)
+
+        _UNFETCHABLE_COMMITS.update(remaining)
+    return complete and not remaining
+
+
+def _missing_commits(commits: list[str]) -> list[str]:
+    """Return the entries of *commits* that are not available locally.
+
+    All SHAs are checked by one ``git cat-file --batch-check`` process, which
+    answers each stdin line with one output line in the same order.  Entries
+    that are not hex object names are skipped, since ledger values are free
+    text and a stray newline would shift every later reply.
+    """
+    commits = [commit for commit in commits if _OBJECT_NAME_RE.match(commit)]
+    if not commits:
+        return []
+    request = "".join(f"{commit}^{{commit}}\n" for commit in commits).encode()
+    try:
+        result = subprocess.run(
+            ["git", "cat-file", "--batch-check"],
+            input=request,
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return commits
+    replies = result.stdout.splitlines()
+    if len(replies) != len(commits):
+        # git stopped partway; the replies can no longer be matched up.
+        return commits
+    # Present commits answer "<sha> commit <size>"; anything else is missing.
+    return [
+        commit
+        for commit, reply in zip(commits, replies, strict=True)
+        if reply.split(b" ")[1:2] != [b"commit"]
     ]
 
-    for command in fetch_attempts:
-        try:
-            subprocess.check_call(
-                command,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        except subprocess.CalledProcessError:
-            continue
 
-        if command[-1] == commit:
-            return True
-
-        # Success without specifying the SHA just deepened the local clone;
-        # try once more to pull the exact commit while the additional history
-        # is available.
-        try:
-            subprocess.check_call(
-                [
-                    "git",
-                    "fetch",
-                    "--no-tags",
-                    "--filter=blob:none",
-                    "origin",
-                    commit,
-                ],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        except subprocess.CalledProcessError:
-            continue
-        return True
+def _prefetch_commits(commits: Iterable[str]) -> None:
+    """Fetch any of *commits* missing from the local clone up front.
 
-    return False
+    Presence is checked in a single batch and the missing SHAs are requested in
+    a single ``git fetch``, so a ledger whose commits are all present costs one
+    git process.
+    """
+    pending = sorted(set(commits))
+    if not pending:
+        return
+    missing = _missing_commits(pending)
+    if missing:
+        _fetch_commits(missing)
 
 
-def _commit_files(commit: str) -> list[str]:
+@lru_cache(maxsize=512)
+def _git_show(commit: str, *options: str) -> bytes:
+    """Return ``git show`` output for *commit*, fetching it once if it is missing.
+
+    Commits are immutable, so output is memoised per commit and option set; a
+    SHA shared by several tasks or ledgers costs one subprocess per query.
+    """
+    command = ["git", "show", *options, commit]
     try:
-        output = subprocess.check_output(
-            ["git", "show", "--pretty=format:", "--name-only", commit],
-            text=True,
-        )
+        return subprocess.check_output(command)
     except subprocess.CalledProcessError as exc:
-        if _fetch_commit(commit):
-            output = subprocess.check_output(
-                ["git", "show", "--pretty=format:", "--name-only", commit],
-                text=True,
-            )
-        else:
+        if not _fetch_commit(commit):
             raise LedgerError(f"unknown commit {commit}") from exc
+    return subprocess.check_output(command)
 
-    stripped_lines = (line.strip() for line in output.splitlines())
-    files = [line for line in stripped_lines if line]
-    return files
+
+def _commit_files(commit: str) -> list[str]:
+    # NUL-separated names arrive unquoted, so paths with spaces, newlines or
+    # non-ASCII characters compare equal to the ledger's own relative path.
+    output = _git_show(commit, "--pretty=format:", "--name-only", "-z")
+    return [name.decode("utf-8", "surrogateescape") for name in output.split(b"\0") if name]
 
 
 def _commit_subject(commit: str) -> str:
+    output = _git_show(commit, "--no-patch", "--pretty=format:%s")
+    return output.decode("utf-8", "replace").strip()
+
+
+def _ledger_relative(ledger_path: Path) -> str:
     try:
-        output = subprocess.check_output(
-            ["git", "show", "--no-patch", "--pretty=format:%s", commit],
-            text=True,
-        )
-    except subprocess.CalledProcessError as exc:
-        if _fetch_commit(commit):
-            output = subprocess.check_output(
-                ["git", "show", "--no-patch", "--pretty=format:%s", commit],
-                text=True,
-            )
-        else:
-            raise LedgerError(f"unknown commit {commit}") from exc
-    return output.strip()
+        return ledger_path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return ledger_path.as_posix()
 
 
 def _validate_task(
-    task: dict[str, Any], *, index: int, seen_ids: set[str], ledger_path: Path
+    task: dict[str, Any],
+    *,
+    index: int,
+    seen_ids: set[str],
+    ledger_path: Path,
+    ledger_relative: str | None = None,
 ) -> list[str]:
     errors: list[str] = []
     context = f"tasks[{index}]"
@@ -232,32 +295,29 @@ def _validate_task(
                             f"{ledger_path}: {context}.commit {commit} has no changed files"
                         )
                     else:
-                        try:
-                            ledger_relative = ledger_path.relative_to(REPO_ROOT).as_posix()
-                        except ValueError:
-                            ledger_relative = ledger_path.as_posix()
+                        if ledger_relative is None:
+                            ledger_relative = _ledger_relative(ledger_path)
 
                         if all(name.startswith(".agents/") for name in files):
-                            allowed_sidecars = {
-                                ledger_relative,
-                                ".agents/.ledger-summary.md",
-                                ".agents/.ledger-start.json",
-                            }
-                            extra_files = [name for name in files if name not in allowed_sidecars]
-
-                            try:
-                                subject = _commit_subject(commit)
-                            except LedgerError as exc:
-                                errors.append(
-                                    f"{ledger_path}: {context}.commit {commit} not found in repository: {exc}"
-                                )
-                                subject = ""
-
-                            if (
-                                extra_files
-                                or ledger_relative not in files
-                                or not subject.lower().startswith("chore(ledger):")
-                            ):
+                            extra_files = [
+                                name
+                                for name in files
+                                if name != ledger_relative and name not in LEDGER_SIDECARS
+                            ]
+
+                            # The subject only matters for a pure ledger commit, so
+                            # skip the git lookup when the file list already fails.
+                            ledger_only = not extra_files and ledger_relative in files
+                            subject = ""
+                            if ledger_only:
+                                try:
+                                    subject = _commit_subject(commit)
+                                except LedgerError as exc:
+                                    errors.append(
+                                        f"{ledger_path}: {context}.commit {commit} not found in repository: {exc}"
+                                    )
+
+                            if not ledger_only or not subject.lower().startswith("chore(ledger):"):
                                 errors.append(
                                     f"{ledger_path}: {context}.commit {commit} must include non-ledger changes"
                                 )
@@ -300,13 +360,31 @@ def validate_ledger(path: Path) -> list[str]:
         problems.append(f"{path}: tasks must be a non-empty list")
         return problems
 
+    _prefetch_commits(
+        task["commit"]
+        for task in tasks
+        if isinstance(task, dict)
+        and task.get("status") == "done"
+        and isinstance(task.get("commit"), str)
+        and HEX_RE.match(task["commit"].lower())
+    )
+
+    ledger_relative = _ledger_relative(path)
     seen_ids: set[str] = set()
     doing_count = 0
     for index, task in enumerate(tasks):
         if not isinstance(task, dict):
             problems.append(f"{path}: tasks[{index}] must be a mapping")
             continue
-        problems.extend(_validate_task(task, index=index, seen_ids=seen_ids, ledger_path=path))
+        problems.extend(
+            _validate_task(
+                task,
+                index=index,
+                seen_ids=seen_ids,
+                ledger_path=path,
+                ledger_relative=ledger_relative,
+            )
+        )
         if task.get("status") == "doing":
             doing_count += 1
 
@@ -321,9 +399,21 @@ def find_ledgers(explicit: Iterable[str]) -> list[Path]:
         return [Path(item) for item in explicit]
     root = proj_path()
     agents_dir = root / ".agents"
-    if not agents_dir.exists():
+    try:
+        entries = os.scandir(agents_dir)
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted(agents_dir.glob("issue-*-ledger.yml"))
+    # Equivalent to glob("issue-*-ledger.yml") without building a Path per entry.
+    min_length = len(LEDGER_PREFIX) + len(LEDGER_SUFFIX)
+    with entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if len(entry.name) >= min_length
+            and entry.name.startswith(LEDGER_PREFIX)
+            and entry.name.endswith(LEDGER_SUFFIX)
+            and entry.is_file()
+        )
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -343,10 +433,13 @@ def main(argv: list[str] | None = None) -> int:
 
     ledgers = find_ledgers(args.paths)
     results: dict[str, list[str]] = {}
-    for path in ledgers:
-        problems = validate_ledger(path)
-        if problems:
-            results[str(path)] = problems
+    if ledgers:
+        # Ledgers are independent and mostly wait on YAML reads and git, so
+        # overlap them; map() keeps the report in discovery order.
+        with ThreadPoolExecutor(max_workers=min(8, len(ledgers))) as pool:
+            for path, problems in zip(ledgers, pool.map(validate_ledger, ledgers), strict=True):
+                if problems:
+                    results[str(path)] = problems
 
     if args.json:
         print(json.dumps(results, indent=2, sort_keys=True))
@@ -4,30 +4,50 @@ from __future__ import annotations
 
 import ast
 import re
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from pathlib import Path
+from typing import Any
 
 ROOT = Path(".")
 PROJECT_DIRS: list[Path] = [Path("src")]
 MYPY_CMD: list[str] = []
 
 
-def _is_str_like(node: ast.AST, str_vars: set[str]) -> bool:
-    if isinstance(node, ast.Constant) and isinstance(node.value, str):
-        return True
-    if isinstance(node, ast.JoinedStr):
-        return True
-    if isinstance(node, ast.Name) and node.id in str_vars:
-        return True
-    if isinstance(node, ast.Call):
-        func = node.func
-        if isinstance(func, ast.Name) and func.id == "str":
-            return True
-        if isinstance(func, ast.Attribute) and func.attr in {"join", "format", "upper"}:
-            return True
+def _is_str_constant(node: ast.Constant, str_vars: set[str]) -> bool:
+    return isinstance(node.value, str)
+
+
+def _is_f_string(node: ast.JoinedStr, str_vars: set[str]) -> bool:
+    return True
+
+
+def _is_str_name(node: ast.Name, str_vars: set[str]) -> bool:
+    return node.id in str_vars
+
+
+def _is_str_call(node: ast.Call, str_vars: set[str]) -> bool:
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id == "str"
+    if isinstance(func, ast.Attribute):
+        return func.attr in {"join", "format", "upper"}
     return False
 
 
+# Keyed on the exact node type; ast node classes are not subclassed in parsed trees.
+_STR_LIKE_CHECKS: dict[type[ast.AST], Callable[[Any, set[str]], bool]] = {
+    ast.Constant: _is_str_constant,
+    ast.JoinedStr: _is_f_string,
+    ast.Name: _is_str_name,
+    ast.Call: _is_str_call,
+}
+
+
+def _is_str_like(node: ast.AST, str_vars: set[str]) -> bool:
+    check = _STR_LIKE_CHECKS.get(type(node))
+    return check is not None and check(node, str_vars)
+
+
 def _is_list_of_str(node: ast.AST, list_vars: set[str]) -> bool:
     if isinstance(node, ast.List):
         return all(_is_str_like(value, set()) for value in node.elts)
@@ -38,17 +58,17 @@ def _collect_string_vars(body: Iterable[ast.stmt]) -> tuple[set[str], set[str]]:
     string_vars: set[str] = set()
     list_vars: set[str] = set()
     for stmt in body:
-        if isinstance(stmt, ast.Assign):
-            if _is_str_like(stmt.value, string_vars):
-                for target in stmt.targets:
-                    if isinstance(target, ast.Name):
-                        string_vars.add(target.id)
-            if isinstance(stmt.value, ast.List) and all(
-                isinstance(elt, (ast.Constant, ast.JoinedStr)) for elt in stmt.value.elts
-            ):
-                for target in stmt.targets:
-                    if isinstance(target, ast.Name):
-                        list_vars.add(target.id)
+        if not isinstance(stmt, ast.Assign):
+            continue
+        names = [target.id for target in stmt.targets if isinstance(target, ast.Name)]
+        if not names:
+            continue
+        if _is_str_like(stmt.value, string_vars):
+            string_vars.update(names)
+        if isinstance(stmt.value, ast.List) and all(
+            isinstance(elt, (ast.Constant, ast.JoinedStr)) for elt in stmt.value.elts
+        ):
+            list_vars.update(names)
     return string_vars, list_vars
 
 
@@ -91,7 +111,11 @@ def _process_function(node: ast.FunctionDef, lines: list[str], str_vars: set[str
 
 
 def _process_file(path: Path) -> bool:
-    text = path.read_text(encoding="utf-8")
+    data = path.read_bytes()
+    # Only annotated returns are rewritten, so files without "->" need no parse.
+    if b"->" not in data:
+        return False
+    text = data.decode("utf-8")
     module = ast.parse(text)
     lines = text.splitlines()
     changed = False
@@ -52,10 +52,19 @@ CORE_DEV_TOOLS = [
     "PYTEST_COV_VERSION",
 ]
 
+# Whitespace is restricted to the current line so one multiline sub can
+# rewrite the whole lockfile without matching across line breaks.
 LOCKFILE_PATTERN = re.compile(
-    r"^(?P<lead>\s*)(?P<name>[A-Za-z0-9_.-]+)==(?P<version>[^\s#]+)(?P<trail>\s*(?:#.*)?)$"
+    r"^(?P<lead>[^\S\n]*)(?P<name>[A-Za-z0-9_.-]+)==(?P<version>[^\s#]+)"
+    r"(?P<trail>[^\S\n]*(?:#.*)?)$",
+    re.MULTILINE,
 )
 
+# Multi-line dev dependencies: dev = [\n ... \n]
+DEV_SECTION_PATTERN = re.compile(r"^dev\s*=\s*\[\s*\n(.*?)\n\s*\]", re.MULTILINE | re.DOTALL)
+# Inline dev dependencies: dev = ["pkg1", "pkg2"]
+DEV_INLINE_PATTERN = re.compile(r"^dev\s*=\s*\[(.*?)\]", re.MULTILINE)
+
 
 def parse_env_file(path: Path) -> dict[str, str]:
     """Parse the autofix-versions.env file into a dict of key=value pairs."""
@@ -83,17 +92,12 @@ def find_dev_dependencies_section(content: str) -> tuple[int, int, str] | None:
     """
     # Look for [project.optional-dependencies] section with dev = [...]
     # Handle both inline and multi-line formats
-
-    # Pattern for multi-line dev dependencies
-    pattern = re.compile(r"^dev\s*=\s*\[\s*\n(.*?)\n\s*\]", re.MULTILINE | re.DOTALL)
-
-    match = pattern.search(content)
+    match = DEV_SECTION_PATTERN.search(content)
     if match:
         return match.start(), match.end(), match.group(0)
 
     # Try inline format: dev = ["pkg1", "pkg2"]
-    inline_pattern = re.compile(r"^dev\s*=\s*\[(.*?)\]", re.MULTILINE)
-    match = inline_pattern.search(content)
+    match = DEV_INLINE_PATTERN.search(content)
     if match:
         return match.start(), match.end(), match.group(0)
 
@@ -177,26 +181,43 @@ def update_dependency_in_section(
 
     Returns (new_section, was_changed).
     """
-    # Pattern to match EXACT package name with any version specifier
-    # The key is using word boundaries and ensuring we match the exact package
-    # Pattern: "package" or "package>=version" or "package[extras]>=version"
-    # We need to be careful not to match "pytest" when looking at "pytest-cov"
+    new_section, updated = update_dependencies_in_section(
+        section, {package: new_version}, use_exact_pin
+    )
+    return new_section, bool(updated)
+
+
+def update_dependencies_in_section(
+    section: str, versions: dict[str, str], use_exact_pin: bool = True
+) -> tuple[str, set[str]]:
+    """Update several dependency versions within a section in one pass.
+
+    Package names are matched exactly and case-insensitively, as in
+    ``update_dependency_in_section``.
+
+    Returns (new_section, lower-cased names that were updated).
+    """
+    if not versions:
+        return section, set()
 
+    targets = {package.lower(): version for package, version in versions.items()}
+    names = "|".join(re.escape(package) for package in versions)
     # Match: "package" + optional version spec, NOT followed by more pkg name chars
     # The negative lookahead (?!-) ensures we don't match "pytest" in "pytest-cov"
     pattern = re.compile(
-        rf'"({re.escape(package)})(?![-\w])(>=|==|~=|>|<|<=|!=)?([^"\[\]]*)?(\[.*?\])?"',
+        rf'"({names})(?![-\w])(>=|==|~=|>|<|<=|!=)?([^"\[\]]*)?(\[.*?\])?"',
         re.IGNORECASE,
     )
+    op = "==" if use_exact_pin else ">="
+    updated: set[str] = set()
 
     def replacer(m: re.Match) -> str:
         pkg_name = m.group(1)
         extras = m.group(4) or ""
-        op = "==" if use_exact_pin else ">="
-        return f'"{pkg_name}{op}{new_version}{extras}"'
+        updated.add(pkg_name.lower())
+        return f'"{pkg_name}{op}{targets[pkg_name.lower()]}{extras}"'
 
-    new_section, count = pattern.subn(replacer, section)
-    return new_section, count > 0
+    return pattern.sub(replacer, section), updated
 
 
 def sync_pyproject(
@@ -264,10 +285,8 @@ def sync_pyproject(
     current_deps = extract_dependencies(section)
     current_packages = {pkg.lower(): (pkg, op, ver) for pkg, op, ver in current_deps}
 
-    # Work on a copy of just the section
-    new_section = section
-
-    # Check each pinned tool
+    # Collect every pinned tool whose version differs, then rewrite them together
+    outdated: dict[str, str] = {}
     for env_key, package_names in TOOL_MAPPING.items():
         if env_key not in pins:
             continue
@@ -278,20 +297,18 @@ def sync_pyproject(
         for pkg_name in package_names:
             pkg_lower = pkg_name.lower()
             if pkg_lower in current_packages:
-                actual_pkg, current_op, current_ver = current_packages[pkg_lower]
-
-                # Check if version differs
+                actual_pkg, _, current_ver = current_packages[pkg_lower]
                 if current_ver != target_version:
-                    new_section, changed = update_dependency_in_section(
-                        new_section, actual_pkg, target_version, use_exact_pins
-                    )
-                    if changed:
-                        op = "==" if use_exact_pins else ">="
-                        changes.append(
-                            f"{actual_pkg}: {current_op}{current_ver} -> {op}{target_version}"
-                        )
+                    outdated[actual_pkg] = target_version
                 break
 
+    new_section, updated = update_dependencies_in_section(section, outdated, use_exact_pins)
+    op = "==" if use_exact_pins else ">="
+    for actual_pkg, target_version in outdated.items():
+        if actual_pkg.lower() in updated:
+            _, current_op, current_ver = current_packages[actual_pkg.lower()]
+            changes.append(f"{actual_pkg}: {current_op}{current_ver} -> {op}{target_version}")
+
     # Replace the section in the full content
     if new_section != section:
         content = content[:section_start] + new_section + content[section_end:]
@@ -321,37 +338,22 @@ def sync_lockfile(
         return [], []
 
     content = lockfile_path.read_text(encoding="utf-8")
-    lines = content.splitlines()
     targets = _build_lockfile_targets(pins)
     changes: list[str] = []
-    updated_lines: list[str] = []
-
-    for line in lines:
-        match = LOCKFILE_PATTERN.match(line)
-        if not match:
-            updated_lines.append(line)
-            continue
 
+    def replace(match: re.Match[str]) -> str:
         name = match.group("name")
         version = match.group("version")
         target_version = targets.get(name.lower())
-        if target_version and version != target_version:
-            changes.append(f"requirements.lock:{name}: {version} -> =={target_version}")
-            if apply:
-                updated_lines.append(
-                    f"{match.group('lead')}{name}=={target_version}{match.group('trail')}"
-                )
-            else:
-                updated_lines.append(line)
-        else:
-            updated_lines.append(line)
-
-    if apply:
-        new_content = "\n".join(updated_lines)
-        if content.endswith("\n"):
-            new_content += "\n"
-        if new_content != content:
-            lockfile_path.write_text(new_content, encoding="utf-8")
+        if not target_version or version == target_version:
+            return match.group(0)
+        changes.append(f"requirements.lock:{name}: {version} -> =={target_version}")
+        return f"{match.group('lead')}{name}=={target_version}{match.group('trail')}"
+
+    new_content = LOCKFILE_PATTERN.sub(replace, content)
+
+    if apply and new_content != content:
+        lockfile_path.write_text(new_content, encoding="utf-8")
 
     return changes, []
 
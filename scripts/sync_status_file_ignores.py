@@ -27,7 +27,13 @@ These patterns prevent merge conflicts from:
 from __future__ import annotations
 
 import argparse
+import base64
+import json
+import os
+import subprocess
 import sys
+import urllib.request
+from functools import lru_cache
 from pathlib import Path
 
 # Canonical status file patterns that should be ignored
@@ -61,43 +67,43 @@ GITIGNORE_BLOCK_HEADER = """# ==================================================
 # =============================================================================
 """
 
+GITHUB_API_URL = "https://api.github.com"
+TEMPLATE_GITIGNORE = Path(__file__).parent.parent / "templates/consumer-repo/.gitignore"
+
+_MINIMAL_BLOCK = "\n".join([GITIGNORE_BLOCK_HEADER.strip(), *CANONICAL_PATTERNS]) + "\n"
+
 
 def load_template_gitignore() -> str:
     """Load the canonical .gitignore template."""
-    template_path = Path(__file__).parent.parent / "templates/consumer-repo/.gitignore"
-    if template_path.exists():
-        return template_path.read_text()
-    # Fallback to generating from patterns
-    return generate_minimal_block()
+    try:
+        return TEMPLATE_GITIGNORE.read_text()
+    except FileNotFoundError:
+        # Fallback to generating from patterns
+        return generate_minimal_block()
 
 
 def generate_minimal_block() -> str:
     """Generate minimal .gitignore block from canonical patterns."""
-    lines = [GITIGNORE_BLOCK_HEADER.strip()]
-    for pattern in CANONICAL_PATTERNS:
-        lines.append(pattern)
-    return "\n".join(lines) + "\n"
+    return _MINIMAL_BLOCK
+
+
+@lru_cache(maxsize=8)
+def _present_lines(content: str) -> frozenset[str]:
+    """Return the non-comment, non-negation patterns listed in ``content``."""
+    stripped = (line.strip() for line in content.splitlines())
+    return frozenset(line for line in stripped if line and line[0] not in "#!")
 
 
 def check_gitignore_content(content: str) -> dict[str, bool]:
     """Check which canonical patterns are present in .gitignore content."""
-    # Normalize: remove comments and empty lines for comparison
-    lines = set()
-    for line in content.splitlines():
-        stripped = line.strip()
-        if stripped and not stripped.startswith("#"):
-            # Handle negation patterns (lines starting with !)
-            if stripped.startswith("!"):
-                continue  # Skip negation patterns
-            lines.add(stripped)
-
-    return {pattern: pattern in lines for pattern in CANONICAL_PATTERNS}
+    present = _present_lines(content)
+    return {pattern: pattern in present for pattern in CANONICAL_PATTERNS}
 
 
 def get_missing_patterns(content: str) -> list[str]:
     """Get list of canonical patterns missing from .gitignore."""
-    status = check_gitignore_content(content)
-    return [pattern for pattern, present in status.items() if not present]
+    present = _present_lines(content)
+    return [pattern for pattern in CANONICAL_PATTERNS if pattern not in present]
 
 
 def generate_append_block(missing: list[str]) -> str:
@@ -114,6 +120,38 @@ def generate_append_block(missing: list[str]) -> str:
     return "\n".join(lines) + "\n"
 
 
+def fetch_repo_gitignore(repo: str) -> str:
+    """Fetch a repo's .gitignore through the GitHub contents API.
+
+    Uses ``GH_TOKEN`` or ``GITHUB_TOKEN`` when set. Without either, defers to
+    ``gh api`` so credentials from ``gh auth login`` still reach private repos.
+    """
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if not token:
+        return _fetch_repo_gitignore_with_gh(repo)
+    request = urllib.request.Request(
+        f"{GITHUB_API_URL}/repos/{repo}/contents/.gitignore",
+        headers={
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {token}",
+        },
+    )
+    with urllib.request.urlopen(request, timeout=15) as resp:
+        payload = json.loads(resp.read())
+    return base64.b64decode(payload["content"]).decode()
+
+
+def _fetch_repo_gitignore_with_gh(repo: str) -> str:
+    result = subprocess.run(
+        ["gh", "api", f"repos/{repo}/contents/.gitignore", "--jq", ".content"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise OSError(result.stderr.strip() or f"gh api exited with {result.returncode}")
+    return base64.b64decode(result.stdout.strip()).decode()
+
+
 def print_check_report(content: str, repo_name: str = "local") -> int:
     """Print a report of pattern coverage and return exit code."""
     status = check_gitignore_content(content)
@@ -200,27 +238,12 @@ def main() -> int:
 
     if args.repo:
         # Check remote repo via GitHub API
-        import subprocess
-
-        result = subprocess.run(
-            [
-                "gh",
-                "api",
-                f"repos/{args.repo}/contents/.gitignore",
-                "--jq",
-                ".content",
-            ],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
+        try:
+            content = fetch_repo_gitignore(args.repo)
+        except (OSError, ValueError, KeyError) as exc:
             print(f"Error fetching .gitignore from {args.repo}", file=sys.stderr)
-            print(result.stderr, file=sys.stderr)
+            print(exc, file=sys.stderr)
             return 1
-
-        import base64
-
-        content = base64.b64decode(result.stdout.strip()).decode()
         return print_check_report(content, args.repo)
 
     # Default: print help
@@ -13,6 +13,8 @@ import ast
 import re
 import sys
 import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
@@ -33,6 +35,8 @@ else:
 
 PYPROJECT_FILE = Path("pyproject.toml")
 DEV_EXTRA = "dev"
+# Below this many test files a thread pool costs more than it saves.
+PARALLEL_SCAN_THRESHOLD = 16
 
 # Stdlib modules that don't need to be installed (keep in sync with
 # tests/test_dependency_enforcement.py)
@@ -188,17 +192,20 @@ def _read_local_modules() -> set[str]:
         return set()
     modules: set[str] = set()
     try:
-        content = LOCAL_MODULES_FILE.read_text(encoding="utf-8")
+        data = LOCAL_MODULES_FILE.read_bytes()
+        # Only entries are decoded; blank and comment lines stay as bytes.
+        entries = [
+            raw.decode("utf-8")
+            for raw in map(bytes.strip, data.splitlines())
+            if raw and not raw.startswith(b"#")
+        ]
     except (OSError, UnicodeDecodeError) as exc:
         print(
             f"Warning: could not read {LOCAL_MODULES_FILE}: {exc}",
             file=sys.stderr,
         )
         return set()
-    for line in content.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
+    for line in entries:
         if not line.isidentifier():
             print(
                 f"Warning: ignoring invalid module name in {LOCAL_MODULES_FILE}: {line!r}",
@@ -241,6 +248,7 @@ def _normalise_package_name(package: str) -> str:
 _SPECIFIER_PATTERN = re.compile(r"[!=<>~]")
 
 
+@lru_cache(maxsize=4096)
 def _extract_requirement_name(entry: str) -> str | None:
     """Return the canonical package name for a requirement entry."""
 
@@ -260,9 +268,13 @@ def _extract_requirement_name(entry: str) -> str | None:
 
 def extract_imports_from_file(file_path: Path) -> set[str]:
     """Extract all top-level import names from a Python file."""
+    data = file_path.read_bytes()
+    # Nested and conditional imports count too, so a regex cannot replace the
+    # AST walk; files without the keyword can still skip parsing entirely.
+    if b"import" not in data:
+        return set()
     try:
-        with open(file_path, encoding="utf-8") as f:
-            tree = ast.parse(f.read(), filename=str(file_path))
+        tree = ast.parse(data, filename=str(file_path))
     except (SyntaxError, UnicodeDecodeError):
         return set()
 
@@ -285,14 +297,14 @@ def get_all_test_imports() -> set[str]:
     if not test_dir.exists():
         return set()
 
-    all_imports = set()
-    for test_file in test_dir.rglob("*.py"):
-        if "__pycache__" in str(test_file):
-            continue
-        imports = extract_imports_from_file(test_file)
-        all_imports.update(imports)
+    test_files = [path for path in test_dir.rglob("*.py") if "__pycache__" not in path.parts]
+    if len(test_files) < PARALLEL_SCAN_THRESHOLD:
+        results = map(extract_imports_from_file, test_files)
+        return set().union(*results)
 
-    return all_imports
+    # Reads release the GIL, so threads overlap I/O on larger suites.
+    with ThreadPoolExecutor() as executor:
+        return set().union(*executor.map(extract_imports_from_file, test_files))
 
 
 def get_declared_dependencies() -> tuple[set[str], dict[str, list[str]]]:
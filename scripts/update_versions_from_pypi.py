@@ -19,6 +19,8 @@ import json
 import re
 import sys
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import NamedTuple
 
@@ -39,6 +41,14 @@ PACKAGE_MAPPING: dict[str, str] = {
     "COVERAGE_VERSION": "coverage",
 }
 
+# Upper bound on concurrent PyPI lookups in check_versions
+MAX_PYPI_WORKERS = 16
+
+# Suffixes marking a prerelease (a, b, rc, dev, alpha, beta + optional number)
+PRERELEASE_PATTERN = re.compile(r"(a|b|rc|dev|alpha|beta)\d*$", re.IGNORECASE)
+# Leading numeric release segment, e.g. "1.2.3" in "1.2.3rc1"
+VERSION_PREFIX_PATTERN = re.compile(r"(\d+(?:\.\d+)*)")
+
 
 class VersionInfo(NamedTuple):
     """Information about a package version."""
@@ -54,44 +64,50 @@ def get_latest_pypi_version(package_name: str) -> str | None:
     This queries the PyPI JSON API and returns the latest non-prerelease version.
     Falls back to the latest release if all releases are prereleases.
     """
-    url = f"https://pypi.org/pypi/{package_name}/json"
     try:
-        with urllib.request.urlopen(url, timeout=15) as resp:
-            data = json.loads(resp.read().decode())
-            # Get the latest version (this is the current stable release)
-            latest: str | None = data.get("info", {}).get("version")
-            if latest:
-                return latest
-
-            # Fallback: find the latest from releases
-            releases: dict[str, list[dict[str, object]]] = data.get("releases", {})
-            if releases:
-                # Filter out prereleases and yanked versions
-                stable_versions: list[str] = []
-                for ver, files in releases.items():
-                    # Skip if all files are yanked
-                    if files and all(f.get("yanked", False) for f in files):
-                        continue
-                    # Skip prereleases (contains a, b, rc, dev, etc.)
-                    if re.search(r"(a|b|rc|dev|alpha|beta)\d*$", ver, re.IGNORECASE):
-                        continue
-                    stable_versions.append(ver)
-
-                if stable_versions:
-                    # Sort by version tuple
-                    stable_versions.sort(key=_version_tuple, reverse=True)
-                    return stable_versions[0]
-
-            return None
+        return _query_latest_pypi_version(package_name)
     except Exception as e:
         print(f"  ⚠️  Could not fetch {package_name} from PyPI: {e}", file=sys.stderr)
         return None
 
 
+@lru_cache(maxsize=256)
+def _query_latest_pypi_version(package_name: str) -> str | None:
+    # Errors propagate so lru_cache only remembers completed lookups.
+    url = f"https://pypi.org/pypi/{package_name}/json"
+    with urllib.request.urlopen(url, timeout=15) as resp:
+        data = json.loads(resp.read().decode())
+    # Get the latest version (this is the current stable release)
+    latest: str | None = data.get("info", {}).get("version")
+    if latest:
+        return latest
+
+    # Fallback: find the latest from releases
+    releases: dict[str, list[dict[str, object]]] = data.get("releases", {})
+    if releases:
+        # Filter out prereleases and yanked versions
+        stable_versions: list[str] = []
+        for ver, files in releases.items():
+            # Skip if all files are yanked
+            if files and all(f.get("yanked", False) for f in files):
+                continue
+            # Skip prereleases (contains a, b, rc, dev, etc.)
+            if PRERELEASE_PATTERN.search(ver):
+                continue
+            stable_versions.append(ver)
+
+        if stable_versions:
+            # Sort by version tuple
+            stable_versions.sort(key=_version_tuple, reverse=True)
+            return stable_versions[0]
+
+    return None
+
+
 def _version_tuple(version: str) -> tuple[int, ...]:
     """Convert version string to tuple for comparison."""
     # Handle versions like "1.2.3rc1" by stripping pre-release suffix
-    clean = re.match(r"(\d+(?:\.\d+)*)", version)
+    clean = VERSION_PREFIX_PATTERN.match(version)
     if clean:
         return tuple(int(x) for x in clean.group(1).split("."))
     return (0,)
@@ -147,15 +163,26 @@ def check_versions(pin_file: Path) -> dict[str, VersionInfo]:
     current_pins = parse_env_file(pin_file)
     results: dict[str, VersionInfo] = {}
 
+    pending: list[tuple[str, str, str]] = []
     for env_key, package_name in PACKAGE_MAPPING.items():
         current_version = current_pins.get(env_key, "")
         if not current_version:
             print(f"  ⚠️  {env_key} not found in pin file")
             continue
+        pending.append((env_key, package_name, current_version))
 
-        print(f"  Checking {package_name}...", end=" ", flush=True)
-        latest_version = get_latest_pypi_version(package_name)
+    if not pending:
+        return results
+
+    # Lookups are network-bound, so overlap them and report in mapping order.
+    with ThreadPoolExecutor(max_workers=min(MAX_PYPI_WORKERS, len(pending))) as executor:
+        latest_versions = executor.map(
+            get_latest_pypi_version, [package_name for _, package_name, _ in pending]
+        )
+        fetched = list(zip(pending, latest_versions, strict=True))
 
+    for (env_key, package_name, current_version), latest_version in fetched:
+        print(f"  Checking {package_name}...", end=" ")
         if latest_version is None:
             print("failed to fetch")
             continue
@@ -6,13 +6,17 @@ from typing import Any
 import pytest
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagnosticsRecorder:
     events: list[dict[str, Any]] = field(default_factory=list)
 
     def record(self, **kwargs: Any) -> None:
         self.events.append(kwargs)
 
+    def record_event(self, event: dict[str, Any]) -> None:
+        """Append a pre-built event mapping without keyword packing."""
+        self.events.append(event)
+
 
 @pytest.fixture()
 def autofix_recorder() -> DiagnosticsRecorder:
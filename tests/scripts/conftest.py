@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def agents_dir(tmp_path: Path) -> Path:
+    """Return an empty ``.agents`` directory under ``tmp_path``."""
+    path = tmp_path / ".agents"
+    path.mkdir()
+    return path
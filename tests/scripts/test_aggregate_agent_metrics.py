@@ -165,6 +165,16 @@ def test_read_ndjson_counts_parse_errors(tmp_path: Path) -> None:
     assert errors == 2
 
 
+def test_read_ndjson_counts_undecodable_line(tmp_path: Path) -> None:
+    path = tmp_path / "metrics.ndjson"
+    path.write_bytes(b'{"key": "value"}\r\n{"bad": "\xff"}\n')
+
+    entries, errors = aggregate_agent_metrics._read_ndjson([path])
+
+    assert entries == [{"key": "value"}]
+    assert errors == 1
+
+
 def test_read_ndjson_counts_unreadable_file(tmp_path: Path) -> None:
     missing = tmp_path / "missing.ndjson"
     entries, errors = aggregate_agent_metrics._read_ndjson([missing])
@@ -182,6 +192,15 @@ def test_classify_entry_prefers_explicit_type() -> None:
     assert aggregate_agent_metrics._classify_entry({"other": "value"}) == "unknown"
 
 
+def test_classify_entry_matches_labels_by_substring() -> None:
+    classify = aggregate_agent_metrics._classify_entry
+    assert classify({"workflow": "agents-keepalive-loop"}) == "keepalive"
+    assert classify({"type": "Reusable-18-Autofix"}) == "autofix"
+    assert classify({"metric_type": "verify-pr"}) == "verifier"
+    assert classify({"metric_type": "other", "verdict": "pass"}) == "verifier"
+    assert classify({"type": "keepalive", "workflow": "autofix"}) == "keepalive"
+
+
 def test_safe_number_helpers() -> None:
     assert aggregate_agent_metrics._safe_int("3") == 3
     assert aggregate_agent_metrics._safe_int("bad") is None
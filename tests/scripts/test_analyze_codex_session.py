@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import json
-import subprocess
+import logging
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import patch
 
@@ -12,6 +13,7 @@ import pytest
 
 # Import functions directly for unit testing
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from scripts import analyze_codex_session
 from scripts.analyze_codex_session import (
     extract_all_tasks_from_pr_body,
     extract_tasks_from_pr_body,
@@ -22,64 +24,40 @@ from scripts.analyze_codex_session import (
 class TestExtractTasksFromPRBody:
     """Tests for PR body task extraction."""
 
-    def test_extracts_unchecked_tasks(self) -> None:
-        pr_body = """
-## Tasks
-
-- [ ] Fix the bug
-- [ ] Add tests
-- [x] Update docs
-"""
-        tasks = extract_tasks_from_pr_body(pr_body)
-        assert tasks == ["Fix the bug", "Add tests"]
-
-    def test_handles_mixed_indentation(self) -> None:
-        pr_body = """
-- [ ] Task 1
-  - [ ] Subtask 1a
-    - [ ] Sub-subtask
-- [ ] Task 2
-"""
-        tasks = extract_tasks_from_pr_body(pr_body)
-        assert "Task 1" in tasks
-        assert "Subtask 1a" in tasks
-        assert "Task 2" in tasks
-
-    def test_handles_uppercase_x(self) -> None:
-        pr_body = """
-- [X] Completed with uppercase
-- [ ] Still pending
-"""
-        tasks = extract_tasks_from_pr_body(pr_body)
-        assert tasks == ["Still pending"]
-
-    def test_empty_body_returns_empty_list(self) -> None:
-        assert extract_tasks_from_pr_body("") == []
-
-    def test_no_checkboxes_returns_empty_list(self) -> None:
-        pr_body = """
-## Description
-This PR fixes a bug.
-
-## Notes
-- Item 1
-- Item 2
-"""
-        assert extract_tasks_from_pr_body(pr_body) == []
-
-    def test_extracts_from_multiple_sections(self) -> None:
-        pr_body = """
-## Tasks
-- [ ] Task from tasks section
-
-## Acceptance Criteria
-- [ ] Criterion 1
-- [ ] Criterion 2
-"""
-        tasks = extract_tasks_from_pr_body(pr_body)
-        assert len(tasks) == 3
-        assert "Task from tasks section" in tasks
-        assert "Criterion 1" in tasks
+    @pytest.mark.parametrize(
+        ("pr_body", "expected"),
+        [
+            pytest.param(
+                "\n## Tasks\n\n- [ ] Fix the bug\n- [ ] Add tests\n- [x] Update docs\n",
+                ["Fix the bug", "Add tests"],
+                id="unchecked-only",
+            ),
+            pytest.param(
+                "\n- [ ] Task 1\n  - [ ] Subtask 1a\n    - [ ] Sub-subtask\n- [ ] Task 2\n",
+                ["Task 1", "Subtask 1a", "Sub-subtask", "Task 2"],
+                id="mixed-indentation",
+            ),
+            pytest.param(
+                "\n- [X] Completed with uppercase\n- [ ] Still pending\n",
+                ["Still pending"],
+                id="uppercase-x",
+            ),
+            pytest.param("", [], id="empty-body"),
+            pytest.param(
+                "\n## Description\nThis PR fixes a bug.\n\n## Notes\n- Item 1\n- Item 2\n",
+                [],
+                id="no-checkboxes",
+            ),
+            pytest.param(
+                "\n## Tasks\n- [ ] Task from tasks section\n\n"
+                "## Acceptance Criteria\n- [ ] Criterion 1\n- [ ] Criterion 2\n",
+                ["Task from tasks section", "Criterion 1", "Criterion 2"],
+                id="multiple-sections",
+            ),
+        ],
+    )
+    def test_extracts_unchecked_tasks(self, pr_body: str, expected: list[str]) -> None:
+        assert extract_tasks_from_pr_body(pr_body) == expected
 
 
 class TestExtractAllTasksFromPRBody:
@@ -102,39 +80,77 @@ class TestExtractAllTasksFromPRBody:
 class TestUpdatePRBodyCheckboxes:
     """Tests for checkbox update logic."""
 
-    def test_checks_completed_task(self) -> None:
-        pr_body = "- [ ] Fix the bug\n- [ ] Add tests"
-        updated = update_pr_body_checkboxes(pr_body, ["Fix the bug"])
-        assert "- [x] Fix the bug" in updated
-        assert "- [ ] Add tests" in updated
-
-    def test_preserves_already_checked(self) -> None:
-        pr_body = "- [x] Already done\n- [ ] New task"
-        updated = update_pr_body_checkboxes(pr_body, ["New task"])
-        assert "- [x] Already done" in updated
-        assert "- [x] New task" in updated
-
-    def test_handles_special_characters_in_task(self) -> None:
-        pr_body = "- [ ] Fix bug (issue #123)"
-        updated = update_pr_body_checkboxes(pr_body, ["Fix bug (issue #123)"])
-        assert "- [x] Fix bug (issue #123)" in updated
-
-    def test_handles_no_matches(self) -> None:
-        pr_body = "- [ ] Task A"
-        updated = update_pr_body_checkboxes(pr_body, ["Nonexistent task"])
-        assert updated == pr_body
-
-    def test_preserves_indentation(self) -> None:
-        pr_body = "  - [ ] Indented task"
-        updated = update_pr_body_checkboxes(pr_body, ["Indented task"])
-        assert "  - [x] Indented task" in updated
+    @pytest.mark.parametrize(
+        ("pr_body", "completed", "expected"),
+        [
+            pytest.param(
+                "- [ ] Fix the bug\n- [ ] Add tests",
+                ["Fix the bug"],
+                "- [x] Fix the bug\n- [ ] Add tests",
+                id="checks-completed",
+            ),
+            pytest.param(
+                "- [x] Already done\n- [ ] New task",
+                ["New task"],
+                "- [x] Already done\n- [x] New task",
+                id="preserves-checked",
+            ),
+            pytest.param(
+                "- [ ] Fix bug (issue #123)",
+                ["Fix bug (issue #123)"],
+                "- [x] Fix bug (issue #123)",
+                id="special-characters",
+            ),
+            pytest.param("- [ ] Task A", ["Nonexistent task"], "- [ ] Task A", id="no-match"),
+            pytest.param(
+                "  - [ ] Indented task",
+                ["Indented task"],
+                "  - [x] Indented task",
+                id="indentation",
+            ),
+            pytest.param(
+                "- [ ] Handle C:\\temp\\1 paths\n- [ ] Other",
+                ["Handle C:\\temp\\1 paths"],
+                "- [x] Handle C:\\temp\\1 paths\n- [ ] Other",
+                id="backslashes",
+            ),
+            pytest.param(
+                "- [ ] Fix the bug in parser\n- [ ] Fix other",
+                ["Fix the bug"],
+                "- [x] Fix the bug in parser\n- [ ] Fix other",
+                id="task-prefix",
+            ),
+        ],
+    )
+    def test_checks_completed_tasks(
+        self, pr_body: str, completed: list[str], expected: str
+    ) -> None:
+        assert update_pr_body_checkboxes(pr_body, completed) == expected
 
 
 class TestCLIScript:
     """Integration tests for the CLI script."""
 
-    @pytest.fixture
-    def sample_session_file(self, tmp_path: Path) -> Path:
+    @pytest.fixture(autouse=True)
+    def restore_root_logging(self) -> Iterator[None]:
+        """Undo the ``logging.basicConfig`` call made by ``main``."""
+        root = logging.getLogger()
+        handlers = root.handlers[:]
+        level = root.level
+        yield
+        for handler in root.handlers:
+            if handler not in handlers:
+                handler.close()
+        root.handlers[:] = handlers
+        root.setLevel(level)
+
+    @pytest.fixture(scope="module")
+    def cli_fixture_dir(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Directory shared by the read-only CLI input files."""
+        return tmp_path_factory.mktemp("codex")
+
+    @pytest.fixture(scope="module")
+    def sample_session_file(self, cli_fixture_dir: Path) -> Path:
         """Create a sample JSONL session file."""
         session_content = """{"type": "thread.started", "thread_id": "test123"}
 {"type": "turn.started", "turn_id": "turn1"}
@@ -142,28 +158,28 @@ class TestCLIScript:
 {"type": "item.completed", "item_type": "command_execution", "command": "pytest", "exit_code": 0}
 {"type": "turn.completed", "turn_id": "turn1"}
 """
-        session_file = tmp_path / "session.jsonl"
+        session_file = cli_fixture_dir / "session.jsonl"
         session_file.write_text(session_content)
         return session_file
 
-    @pytest.fixture
-    def sample_pr_body_file(self, tmp_path: Path) -> Path:
+    @pytest.fixture(scope="module")
+    def sample_pr_body_file(self, cli_fixture_dir: Path) -> Path:
         """Create a sample PR body file."""
         pr_body = """## Tasks
 - [ ] Fix the bug
 - [ ] Add tests
 - [ ] Update documentation
 """
-        pr_body_file = tmp_path / "pr_body.md"
+        pr_body_file = cli_fixture_dir / "pr_body.md"
         pr_body_file.write_text(pr_body)
         return pr_body_file
 
-    def test_cli_runs_with_task_args(self, sample_session_file: Path, tmp_path: Path) -> None:
+    def test_cli_runs_with_task_args(
+        self, sample_session_file: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test CLI with --tasks argument."""
-        result = subprocess.run(
+        exit_code = analyze_codex_session.main(
             [
-                sys.executable,
-                "scripts/analyze_codex_session.py",
                 "--session-file",
                 str(sample_session_file),
                 "--tasks",
@@ -171,80 +187,68 @@ class TestCLIScript:
                 "Add tests",
                 "--output",
                 "json",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent.parent,
+            ]
         )
+        captured = capsys.readouterr()
 
         # Should succeed (exit 0)
-        assert result.returncode == 0, f"stderr: {result.stderr}"
+        assert exit_code == 0, f"stderr: {captured.err}"
 
         # Output should be valid JSON
-        output = json.loads(result.stdout)
+        output = json.loads(captured.out)
         assert "provider" in output
         assert "confidence" in output
 
     def test_cli_runs_with_pr_body_file(
-        self, sample_session_file: Path, sample_pr_body_file: Path
+        self,
+        sample_session_file: Path,
+        sample_pr_body_file: Path,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test CLI with --pr-body-file argument."""
-        result = subprocess.run(
+        exit_code = analyze_codex_session.main(
             [
-                sys.executable,
-                "scripts/analyze_codex_session.py",
                 "--session-file",
                 str(sample_session_file),
                 "--pr-body-file",
                 str(sample_pr_body_file),
                 "--output",
                 "json",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent.parent,
+            ]
         )
 
-        assert result.returncode == 0, f"stderr: {result.stderr}"
+        assert exit_code == 0, f"stderr: {capsys.readouterr().err}"
 
     def test_cli_returns_2_for_missing_session(self, tmp_path: Path) -> None:
         """Test CLI returns exit code 2 for missing session file."""
-        result = subprocess.run(
+        exit_code = analyze_codex_session.main(
             [
-                sys.executable,
-                "scripts/analyze_codex_session.py",
                 "--session-file",
                 str(tmp_path / "nonexistent.jsonl"),
                 "--tasks",
                 "Some task",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent.parent,
+            ]
         )
 
-        assert result.returncode == 2
+        assert exit_code == 2
 
-    def test_cli_markdown_output(self, sample_session_file: Path, tmp_path: Path) -> None:
+    def test_cli_markdown_output(
+        self, sample_session_file: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test CLI with markdown output format."""
-        result = subprocess.run(
+        exit_code = analyze_codex_session.main(
             [
-                sys.executable,
-                "scripts/analyze_codex_session.py",
                 "--session-file",
                 str(sample_session_file),
                 "--tasks",
                 "Fix the bug",
                 "--output",
                 "markdown",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent.parent,
+            ]
         )
 
-        assert result.returncode == 0
-        assert "**Analysis Summary**" in result.stdout
+        assert exit_code == 0
+        assert "**Analysis Summary**" in capsys.readouterr().out
 
     def test_cli_update_pr_body_option(
         self, sample_session_file: Path, sample_pr_body_file: Path, tmp_path: Path
@@ -253,15 +257,13 @@ class TestCLIScript:
         updated_file = tmp_path / "updated_body.md"
 
         # Mock the LLM to return a known completion
-        with patch("tools.llm_provider.get_llm_provider") as mock_provider:
+        with patch("tools.codex_session_analyzer.get_llm_provider") as mock_provider:
             from tools.llm_provider import RegexFallbackProvider
 
             mock_provider.return_value = RegexFallbackProvider()
 
-            result = subprocess.run(
+            exit_code = analyze_codex_session.main(
                 [
-                    sys.executable,
-                    "scripts/analyze_codex_session.py",
                     "--session-file",
                     str(sample_session_file),
                     "--pr-body-file",
@@ -271,10 +273,7 @@ class TestCLIScript:
                     "--update-pr-body",
                     "--updated-body-file",
                     str(updated_file),
-                ],
-                capture_output=True,
-                text=True,
-                cwd=Path(__file__).parent.parent.parent,
+                ]
             )
 
-            assert result.returncode == 0
+            assert exit_code == 0
@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import pytest
+
 from scripts import auto_type_hygiene
 
 
+@pytest.fixture(autouse=True)
+def _clear_type_caches():
+    auto_type_hygiene.module_has_types.cache_clear()
+    auto_type_hygiene._has_stub_package.cache_clear()
+    yield
+    auto_type_hygiene.module_has_types.cache_clear()
+    auto_type_hygiene._has_stub_package.cache_clear()
+
+
 def test_load_allowlist_defaults_when_missing_or_empty(monkeypatch):
     monkeypatch.delenv("AUTO_TYPE_ALLOWLIST", raising=False)
     assert auto_type_hygiene._load_allowlist() == auto_type_hygiene.DEFAULT_ALLOWLIST
@@ -159,7 +170,9 @@ def test_iter_python_files_skips_excluded_paths(tmp_path, monkeypatch):
     assert files == [keep]
 
 
-def test_main_dry_run_reports_changes(tmp_path, monkeypatch, capsys):
+@pytest.fixture
+def sample_repo(tmp_path, monkeypatch):
+    """Point the script at a one-file repo and return that file."""
     module_root = tmp_path / "repo"
     module_root.mkdir()
     file_path = module_root / "sample.py"
@@ -167,6 +180,10 @@ def test_main_dry_run_reports_changes(tmp_path, monkeypatch, capsys):
 
     monkeypatch.setattr(auto_type_hygiene, "ROOT", module_root)
     monkeypatch.setattr(auto_type_hygiene, "SRC_DIRS", [module_root])
+    return file_path
+
+
+def test_main_dry_run_reports_changes(sample_repo, monkeypatch, capsys):
     monkeypatch.setattr(auto_type_hygiene, "DRY_RUN", True)
     monkeypatch.setattr(auto_type_hygiene, "needs_ignore", lambda module: True)
 
@@ -175,17 +192,10 @@ def test_main_dry_run_reports_changes(tmp_path, monkeypatch, capsys):
 
     assert exit_code == 0
     assert "Added import-untyped ignores" in output
-    assert file_path.read_text(encoding="utf-8") == "import foo\n"
+    assert sample_repo.read_text(encoding="utf-8") == "import foo\n"
 
 
-def test_main_reports_no_changes(tmp_path, monkeypatch, capsys):
-    module_root = tmp_path / "repo"
-    module_root.mkdir()
-    file_path = module_root / "sample.py"
-    file_path.write_text("import foo\n", encoding="utf-8")
-
-    monkeypatch.setattr(auto_type_hygiene, "ROOT", module_root)
-    monkeypatch.setattr(auto_type_hygiene, "SRC_DIRS", [module_root])
+def test_main_reports_no_changes(sample_repo, monkeypatch, capsys):
     monkeypatch.setattr(auto_type_hygiene, "DRY_RUN", False)
     monkeypatch.setattr(auto_type_hygiene, "needs_ignore", lambda module: False)
 
@@ -194,21 +204,14 @@ def test_main_reports_no_changes(tmp_path, monkeypatch, capsys):
 
     assert exit_code == 0
     assert output.strip() == "[auto_type_hygiene] No changes needed."
-    assert file_path.read_text(encoding="utf-8") == "import foo\n"
+    assert sample_repo.read_text(encoding="utf-8") == "import foo\n"
 
 
-def test_main_writes_changes(tmp_path, monkeypatch):
-    module_root = tmp_path / "repo"
-    module_root.mkdir()
-    file_path = module_root / "sample.py"
-    file_path.write_text("import foo\n", encoding="utf-8")
-
-    monkeypatch.setattr(auto_type_hygiene, "ROOT", module_root)
-    monkeypatch.setattr(auto_type_hygiene, "SRC_DIRS", [module_root])
+def test_main_writes_changes(sample_repo, monkeypatch):
     monkeypatch.setattr(auto_type_hygiene, "DRY_RUN", False)
     monkeypatch.setattr(auto_type_hygiene, "needs_ignore", lambda module: True)
 
     exit_code = auto_type_hygiene.main()
 
     assert exit_code == 0
-    assert auto_type_hygiene.IGNORE_TOKEN in file_path.read_text(encoding="utf-8")
+    assert auto_type_hygiene.IGNORE_TOKEN in sample_repo.read_text(encoding="utf-8")
@@ -1,5 +1,7 @@
+import io
 import json
 import xml.etree.ElementTree as ET
+from contextlib import redirect_stdout
 from pathlib import Path
 
 from scripts import classify_test_failures
@@ -38,6 +40,21 @@ def test_classify_reports_handles_parse_error(tmp_path: Path) -> None:
     assert summary["unknown"][0]["id"].startswith("<parse-error>:")
 
 
+def test_classify_reports_drops_cases_from_truncated_report(tmp_path: Path) -> None:
+    report = tmp_path / "truncated-report.xml"
+    report.write_text(
+        '<testsuite>\n<testcase classname="pkg" name="test_fail">'
+        '<failure message="boom"/></testcase>\n<testcase',
+        encoding="utf-8",
+    )
+
+    summary = classify_test_failures.classify_reports([report])
+
+    assert summary["total_failures"] == 1
+    assert summary["runtime"] == []
+    assert summary["unknown"][0]["id"] == "<parse-error>:truncated-report.xml"
+
+
 def test_classify_reports_classifies_markers_and_dedupes(tmp_path: Path) -> None:
     body = """
     <testcase classname="pkg.test_mod" name="test_runtime">
@@ -104,6 +121,7 @@ def test_failure_message_and_test_id_helpers() -> None:
     assert (
         classify_test_failures._test_id(unnamed_case, Path("report.xml")) == "report.xml::testcase"
     )
+    assert classify_test_failures._test_id(unnamed_case, "report.xml") == "report.xml::testcase"
     empty_case = ET.fromstring("<testcase></testcase>")
     assert classify_test_failures._failure_message(empty_case) == ("", "failure")
 
@@ -175,3 +193,14 @@ def test_main_with_missing_report_prints_empty_summary(tmp_path: Path, capsys, m
     assert status == 0
     captured = capsys.readouterr()
     assert '"total_failures": 0' in captured.out
+
+
+def test_main_writes_to_text_only_stdout(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    stream = io.StringIO()
+
+    with redirect_stdout(stream):
+        status = classify_test_failures.main(["missing-report.xml"])
+
+    assert status == 0
+    assert json.loads(stream.getvalue())["total_failures"] == 0
@@ -63,6 +63,23 @@ def test_main_replaces_matching_run_id_and_sorts(
     assert records[1]["coverage"] == 75.0
 
 
+def test_main_keeps_existing_lines_byte_identical(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    history_path = tmp_path / "history.ndjson"
+    record_path = tmp_path / "record.json"
+    existing = {"run_id": 1, "run_number": 1, "coverage": 70.0, "branch": "café"}
+    _write_ndjson(history_path, [existing])
+    original = history_path.read_bytes()
+    record_path.write_text(json.dumps({"run_id": 2, "run_number": 2}), encoding="utf-8")
+
+    monkeypatch.setenv("HISTORY_PATH", str(history_path))
+    monkeypatch.setenv("RECORD_PATH", str(record_path))
+
+    assert coverage_history_append.main() == 0
+    assert history_path.read_bytes() == original + b'{"run_id": 2, "run_number": 2}\n'
+
+
 def test_main_sorts_by_run_id_when_no_run_number(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -66,3 +66,30 @@ def test_main_scans_tests_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch)
 
     assert exit_code == 0
     assert "values.tolist()" in target.read_text(encoding="utf-8")
+
+
+def test_process_file_rewrites_only_tracked_assert_lines(tmp_path: Path) -> None:
+    target = tmp_path / "test_case.py"
+    _write_lines(
+        target,
+        [
+            "import numpy as np",
+            "arr = np.array([1, 2])",
+            "plain = [1, 2]",
+            "    assert arr == [1, 2]  # note",
+            "assert plain == [1, 2]",
+            "assert arr.tolist() == [1, 2]",
+        ],
+    )
+
+    changed = fix_numpy_asserts.process_file(target)
+
+    assert changed is True
+    assert target.read_text(encoding="utf-8") == (
+        "import numpy as np\n"
+        "arr = np.array([1, 2])\n"
+        "plain = [1, 2]\n"
+        "    assert arr.tolist() == [1, 2]\n"
+        "assert plain == [1, 2]\n"
+        "assert arr.tolist() == [1, 2]\n"
+    )
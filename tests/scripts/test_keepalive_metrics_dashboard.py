@@ -28,6 +28,17 @@ def test_read_ndjson_handles_invalid_lines(tmp_path) -> None:
     assert errors == 2
 
 
+def test_read_ndjson_memory_maps_large_files(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "metrics.ndjson"
+    path.write_bytes(b'{"pr_number": 1}\n\nnot json\n{"pr_number": 2}\r\n{"pr_number": 3}')
+    monkeypatch.setattr(dashboard, "MMAP_THRESHOLD", 1)
+
+    entries, errors = dashboard._read_ndjson(path)
+
+    assert entries == [{"pr_number": 1}, {"pr_number": 2}, {"pr_number": 3}]
+    assert errors == 1
+
+
 def test_read_ndjson_missing_file(tmp_path) -> None:
     entries, errors = dashboard._read_ndjson(tmp_path / "missing.ndjson")
 
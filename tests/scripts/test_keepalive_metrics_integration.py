@@ -23,15 +23,16 @@ def test_keepalive_metrics_smoke(tmp_path: Path) -> None:
     result = subprocess.run(
         ["node", str(HARNESS)],
         capture_output=True,
-        text=True,
         check=False,
     )
     if result.returncode != 0:
         pytest.fail(
-            f"Harness failed with code {result.returncode}:\nSTDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
+            f"Harness failed with code {result.returncode}:\n"
+            f"STDOUT:\n{result.stdout.decode('utf-8', 'replace')}\n"
+            f"STDERR:\n{result.stderr.decode('utf-8', 'replace')}"
         )
 
-    record = json.loads(result.stdout or "{}")
+    record = json.loads(result.stdout or b"{}")
     collector.validate_record(record)
 
     output_path = tmp_path / "metrics.ndjson"
@@ -1,4 +1,3 @@
-import textwrap
 from pathlib import Path
 
 import pytest
@@ -6,9 +5,26 @@ import yaml
 
 from scripts import ledger_migrate_base
 
+# Prefer the libyaml-backed safe dumper/loader when PyYAML was built with it.
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Stale develop-based ledger, shared by the main() check and update tests.
+_STALE_LEDGER_YAML = b"base: develop\nitems: []\n"
+
+# Ledger fixtures for the migrate_ledger tests.
+_DEVELOP_LEDGER_WITH_ITEMS_YAML = b"base: develop\nitems:\n- one\n"
+_DEVELOP_LEDGER_YAML = b"base: develop\n"
+_MAIN_LEDGER_YAML = b"base: main\n"
+_MAIN_LEDGER_WITH_ITEMS_YAML = b"base: main\nitems: []\n"
+
 
 def _write_ledger(path, data) -> None:
-    path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    path.write_bytes(yaml.dump(data, Dumper=_YAML_DUMPER, sort_keys=False, encoding="utf-8"))
+
+
+def _read_ledger(path):
+    return yaml.load(path.read_text(encoding="utf-8"), Loader=_YAML_LOADER)
 
 
 def test_detect_default_branch_explicit_override() -> None:
@@ -17,92 +33,85 @@ def test_detect_default_branch_explicit_override() -> None:
         ledger_migrate_base.detect_default_branch("   ")
 
 
-def test_detect_default_branch_from_remote_show(monkeypatch) -> None:
+_REMOTE_SHOW = ("remote", "show", "origin")
+_ORIGIN_HEAD_REF = ("symbolic-ref", "--quiet", "refs/remotes/origin/HEAD")
+_ORIGIN_HEAD_ABBREV = ("rev-parse", "--abbrev-ref", "origin/HEAD")
+_LOCAL_HEAD_REF = ("symbolic-ref", "--quiet", "HEAD")
+
+
+def _make_git_fake(responses, errors=None):
+    """Return a ``_run_git`` stand-in answering from ``responses``/``errors``."""
+    errors = errors or {}
+
     def fake_run(args):
-        assert args == ["remote", "show", "origin"]
-        return "  HEAD branch: trunk\n"
+        key = tuple(args)
+        if key in errors:
+            raise ledger_migrate_base.MigrationError(errors[key])
+        if key in responses:
+            return responses[key]
+        raise AssertionError(f"unexpected args: {args}")
+
+    return fake_run
+
+
+def test_detect_default_branch_from_remote_show(monkeypatch) -> None:
+    fake_run = _make_git_fake({_REMOTE_SHOW: "  HEAD branch: trunk\n"})
 
     monkeypatch.setattr(ledger_migrate_base, "_run_git", fake_run)
     assert ledger_migrate_base.detect_default_branch() == "trunk"
 
 
 def test_detect_default_branch_from_symbolic_ref_origin(monkeypatch) -> None:
-    def fake_run(args):
-        if args == ["remote", "show", "origin"]:
-            raise ledger_migrate_base.MigrationError("no remote")
-        if args == ["symbolic-ref", "--quiet", "refs/remotes/origin/HEAD"]:
-            return "refs/remotes/origin/main\n"
-        raise AssertionError(f"unexpected args: {args}")
+    fake_run = _make_git_fake(
+        {_ORIGIN_HEAD_REF: "refs/remotes/origin/main\n"},
+        {_REMOTE_SHOW: "no remote"},
+    )
 
     monkeypatch.setattr(ledger_migrate_base, "_run_git", fake_run)
     assert ledger_migrate_base.detect_default_branch() == "main"
 
 
 def test_detect_default_branch_ignores_blank_head_branch(monkeypatch) -> None:
-    def fake_run(args):
-        if args == ["remote", "show", "origin"]:
-            return "  HEAD branch:\n"
-        if args == ["symbolic-ref", "--quiet", "refs/remotes/origin/HEAD"]:
-            return "refs/heads/dev\n"
-        raise AssertionError(f"unexpected args: {args}")
+    fake_run = _make_git_fake(
+        {_REMOTE_SHOW: "  HEAD branch:\n", _ORIGIN_HEAD_REF: "refs/heads/dev\n"}
+    )
 
     monkeypatch.setattr(ledger_migrate_base, "_run_git", fake_run)
     assert ledger_migrate_base.detect_default_branch() == "dev"
 
 
 def test_detect_default_branch_returns_raw_ref(monkeypatch) -> None:
-    def fake_run(args):
-        if args == ["remote", "show", "origin"]:
-            raise ledger_migrate_base.MigrationError("no remote")
-        if args == ["symbolic-ref", "--quiet", "refs/remotes/origin/HEAD"]:
-            return "feature\n"
-        raise AssertionError(f"unexpected args: {args}")
+    fake_run = _make_git_fake({_ORIGIN_HEAD_REF: "feature\n"}, {_REMOTE_SHOW: "no remote"})
 
     monkeypatch.setattr(ledger_migrate_base, "_run_git", fake_run)
     assert ledger_migrate_base.detect_default_branch() == "feature"
 
 
 def test_detect_default_branch_falls_back_to_current_branch(monkeypatch) -> None:
-    def fake_run(args):
-        if args == ["remote", "show", "origin"]:
-            raise ledger_migrate_base.MigrationError("no remote")
-        if args == ["symbolic-ref", "--quiet", "refs/remotes/origin/HEAD"]:
-            raise ledger_migrate_base.MigrationError("no origin head")
-        if args == ["rev-parse", "--abbrev-ref", "origin/HEAD"]:
-            return "origin/HEAD\n"
-        if args == ["symbolic-ref", "--quiet", "HEAD"]:
-            return "release\n"
-        raise AssertionError(f"unexpected args: {args}")
+    fake_run = _make_git_fake(
+        {_ORIGIN_HEAD_ABBREV: "origin/HEAD\n", _LOCAL_HEAD_REF: "release\n"},
+        {_REMOTE_SHOW: "no remote", _ORIGIN_HEAD_REF: "no origin head"},
+    )
 
     monkeypatch.setattr(ledger_migrate_base, "_run_git", fake_run)
     assert ledger_migrate_base.detect_default_branch() == "release"
 
 
 def test_detect_default_branch_falls_back_to_head(monkeypatch) -> None:
-    def fake_run(args):
-        if args == ["remote", "show", "origin"]:
-            raise ledger_migrate_base.MigrationError("no remote")
-        if args == ["symbolic-ref", "--quiet", "refs/remotes/origin/HEAD"]:
-            raise ledger_migrate_base.MigrationError("no origin head")
-        if args == ["rev-parse", "--abbrev-ref", "origin/HEAD"]:
-            return "origin/HEAD\n"
-        if args == ["symbolic-ref", "--quiet", "HEAD"]:
-            return "refs/heads/release\n"
-        raise AssertionError(f"unexpected args: {args}")
+    fake_run = _make_git_fake(
+        {_ORIGIN_HEAD_ABBREV: "origin/HEAD\n", _LOCAL_HEAD_REF: "refs/heads/release\n"},
+        {_REMOTE_SHOW: "no remote", _ORIGIN_HEAD_REF: "no origin head"},
+    )
 
     monkeypatch.setattr(ledger_migrate_base, "_run_git", fake_run)
     assert ledger_migrate_base.detect_default_branch() == "release"
 
 
 def test_detect_default_branch_from_rev_parse(monkeypatch) -> None:
-    def fake_run(args):
-        if args == ["remote", "show", "origin"]:
-            raise ledger_migrate_base.MigrationError("no remote")
-        if args == ["symbolic-ref", "--quiet", "refs/remotes/origin/HEAD"]:
-            raise ledger_migrate_base.MigrationError("no origin head")
-        if args == ["rev-parse", "--abbrev-ref", "origin/HEAD"]:
-            return "origin/stable\n"
-        raise AssertionError(f"unexpected args: {args}")
+    fake_run = _make_git_fake(
+        {_ORIGIN_HEAD_ABBREV: "origin/stable\n"},
+        {_REMOTE_SHOW: "no remote", _ORIGIN_HEAD_REF: "no origin head"},
+    )
 
     monkeypatch.setattr(ledger_migrate_base, "_run_git", fake_run)
     assert ledger_migrate_base.detect_default_branch() == "stable"
@@ -129,7 +138,7 @@ def test_run_git_returns_stdout(monkeypatch) -> None:
 
 def test_load_ledger_requires_mapping(tmp_path) -> None:
     ledger_path = tmp_path / "issue-1-ledger.yml"
-    ledger_path.write_text("- item\n", encoding="utf-8")
+    ledger_path.write_bytes(b"- item\n")
     with pytest.raises(ledger_migrate_base.MigrationError, match="ledger must be a mapping"):
         ledger_migrate_base.load_ledger(ledger_path)
 
@@ -146,30 +155,30 @@ def test_load_ledger_returns_none_for_non_string_base(tmp_path) -> None:
 
 def test_migrate_ledger_updates_when_needed(tmp_path) -> None:
     ledger_path = tmp_path / "issue-2-ledger.yml"
-    _write_ledger(ledger_path, {"base": "develop", "items": ["one"]})
+    ledger_path.write_bytes(_DEVELOP_LEDGER_WITH_ITEMS_YAML)
 
     result = ledger_migrate_base.migrate_ledger(ledger_path, "main", check=False)
 
     assert result.changed is True
     assert result.previous == "develop"
     assert result.updated == "main"
-    assert yaml.safe_load(ledger_path.read_text(encoding="utf-8"))["base"] == "main"
+    assert _read_ledger(ledger_path)["base"] == "main"
 
 
 def test_migrate_ledger_check_mode_does_not_write(tmp_path) -> None:
     ledger_path = tmp_path / "issue-3-ledger.yml"
-    _write_ledger(ledger_path, {"base": "develop"})
+    ledger_path.write_bytes(_DEVELOP_LEDGER_YAML)
 
     result = ledger_migrate_base.migrate_ledger(ledger_path, "main", check=True)
 
     assert result.changed is False
     assert result.updated is None
-    assert yaml.safe_load(ledger_path.read_text(encoding="utf-8"))["base"] == "develop"
+    assert _read_ledger(ledger_path)["base"] == "develop"
 
 
 def test_migrate_ledger_noop_when_matching(tmp_path) -> None:
     ledger_path = tmp_path / "issue-4-ledger.yml"
-    _write_ledger(ledger_path, {"base": "main"})
+    ledger_path.write_bytes(_MAIN_LEDGER_YAML)
 
     result = ledger_migrate_base.migrate_ledger(ledger_path, "main", check=True)
 
@@ -179,7 +188,7 @@ def test_migrate_ledger_noop_when_matching(tmp_path) -> None:
 
 def test_migrate_ledger_noop_when_matching_without_check(tmp_path) -> None:
     ledger_path = tmp_path / "issue-5-ledger.yml"
-    _write_ledger(ledger_path, {"base": "main", "items": []})
+    ledger_path.write_bytes(_MAIN_LEDGER_WITH_ITEMS_YAML)
 
     result = ledger_migrate_base.migrate_ledger(ledger_path, "main", check=False)
 
@@ -202,13 +211,12 @@ def test_find_repo_root_returns_path(monkeypatch) -> None:
     assert ledger_migrate_base.find_repo_root() == Path("/tmp/repo")
 
 
-def test_discover_ledgers_lists_agents(tmp_path) -> None:
-    agents_dir = tmp_path / ".agents"
-    agents_dir.mkdir()
+def test_discover_ledgers_lists_agents(tmp_path, agents_dir: Path) -> None:
     first = agents_dir / "issue-1-ledger.yml"
     second = agents_dir / "issue-2-ledger.yml"
-    first.write_text("base: main\n", encoding="utf-8")
-    second.write_text("base: main\n", encoding="utf-8")
+    # Discovery only globs file names, so empty ledgers are enough.
+    first.touch()
+    second.touch()
 
     assert ledger_migrate_base.discover_ledgers(tmp_path) == [first, second]
 
@@ -227,11 +235,9 @@ def test_main_reports_no_ledgers(monkeypatch, capsys, tmp_path) -> None:
     assert "No ledgers found" in out
 
 
-def test_main_check_reports_no_mismatches(monkeypatch, capsys, tmp_path) -> None:
-    agents_dir = tmp_path / ".agents"
-    agents_dir.mkdir()
+def test_main_check_reports_no_mismatches(monkeypatch, capsys, tmp_path, agents_dir: Path) -> None:
     ledger_path = agents_dir / "issue-11-ledger.yml"
-    ledger_path.write_text("base: main\n", encoding="utf-8")
+    ledger_path.write_bytes(b"base: main\n")
 
     monkeypatch.setattr(ledger_migrate_base, "find_repo_root", lambda: tmp_path)
     monkeypatch.setattr(ledger_migrate_base, "detect_default_branch", lambda _=None: "main")
@@ -244,19 +250,9 @@ def test_main_check_reports_no_mismatches(monkeypatch, capsys, tmp_path) -> None
     assert "All ledgers already track the default branch." in out
 
 
-def test_main_check_reports_mismatches(monkeypatch, capsys, tmp_path) -> None:
-    agents_dir = tmp_path / ".agents"
-    agents_dir.mkdir()
+def test_main_check_reports_mismatches(monkeypatch, capsys, tmp_path, agents_dir: Path) -> None:
     ledger_path = agents_dir / "issue-9-ledger.yml"
-    ledger_path.write_text(
-        textwrap.dedent(
-            """\
-        base: develop
-        items: []
-        """
-        ),
-        encoding="utf-8",
-    )
+    ledger_path.write_bytes(_STALE_LEDGER_YAML)
 
     monkeypatch.setattr(ledger_migrate_base, "find_repo_root", lambda: tmp_path)
     monkeypatch.setattr(ledger_migrate_base, "detect_default_branch", lambda _=None: "main")
@@ -269,11 +265,9 @@ def test_main_check_reports_mismatches(monkeypatch, capsys, tmp_path) -> None:
     assert str(ledger_path) in out
 
 
-def test_main_updates_ledgers(monkeypatch, capsys, tmp_path) -> None:
-    agents_dir = tmp_path / ".agents"
-    agents_dir.mkdir()
+def test_main_updates_ledgers(monkeypatch, capsys, tmp_path, agents_dir: Path) -> None:
     ledger_path = agents_dir / "issue-12-ledger.yml"
-    _write_ledger(ledger_path, {"base": "develop", "items": []})
+    ledger_path.write_bytes(_STALE_LEDGER_YAML)
 
     monkeypatch.setattr(ledger_migrate_base, "find_repo_root", lambda: tmp_path)
     monkeypatch.setattr(ledger_migrate_base, "detect_default_branch", lambda _=None: "main")
@@ -284,7 +278,7 @@ def test_main_updates_ledgers(monkeypatch, capsys, tmp_path) -> None:
     out = capsys.readouterr().out
     assert "Updated ledgers:" in out
     assert str(ledger_path) in out
-    assert yaml.safe_load(ledger_path.read_text(encoding="utf-8"))["base"] == "main"
+    assert _read_ledger(ledger_path)["base"] == "main"
 
 
 def test_main_emits_error_on_detection_failure(monkeypatch, capsys) -> None:
@@ -300,11 +294,9 @@ def test_main_emits_error_on_detection_failure(monkeypatch, capsys) -> None:
     assert "::error::boom" in err
 
 
-def test_main_reports_no_updates(monkeypatch, capsys, tmp_path) -> None:
-    agents_dir = tmp_path / ".agents"
-    agents_dir.mkdir()
+def test_main_reports_no_updates(monkeypatch, capsys, tmp_path, agents_dir: Path) -> None:
     ledger_path = agents_dir / "issue-33-ledger.yml"
-    ledger_path.write_text("base: main\n", encoding="utf-8")
+    ledger_path.write_bytes(b"base: main\n")
 
     monkeypatch.setattr(ledger_migrate_base, "find_repo_root", lambda: tmp_path)
     monkeypatch.setattr(ledger_migrate_base, "detect_default_branch", lambda _=None: "main")
@@ -6,109 +6,180 @@ import types
 from pathlib import Path
 
 import pytest
-import yaml
 
-
-def _load_module(monkeypatch, tmp_path: Path):
+# Static ledger documents, kept as YAML literals so tests skip the emitter.
+_DONE_TASK_LEDGER_YAML = (
+    b"version: 1\n"
+    b"issue: 1\n"
+    b"base: main\n"
+    b"branch: feature/ledger\n"
+    b"tasks:\n"
+    b"- id: task-1\n"
+    b"  title: Ship it\n"
+    b"  status: done\n"
+    b"  commit: abcdef1\n"
+)
+
+_VALID_LEDGER_YAML = (
+    b"version: 1\n"
+    b"issue: 1\n"
+    b"base: main\n"
+    b"branch: feature\n"
+    b"tasks:\n"
+    b"- id: task-1\n"
+    b"  title: Ok\n"
+    b"  status: todo\n"
+)
+
+_BAD_ISSUE_LEDGER_YAML = (
+    b"version: 1\n"
+    b"issue: nope\n"
+    b"base: main\n"
+    b"branch: feature\n"
+    b"tasks:\n"
+    b"- id: task-1\n"
+    b"  title: Ok\n"
+    b"  status: todo\n"
+)
+
+_VERSION_2_LEDGER_YAML = (
+    b"version: 2\n"
+    b"issue: 10\n"
+    b"base: main\n"
+    b"branch: feature/ledger\n"
+    b"tasks:\n"
+    b"- id: task-1\n"
+    b"  title: Example\n"
+    b"  status: todo\n"
+)
+
+
+@pytest.fixture(scope="session")
+def _ledger_validate_module():
     utils_mod = types.ModuleType("utils")
     paths_mod = types.ModuleType("utils.paths")
-    paths_mod.proj_path = lambda: tmp_path
-    monkeypatch.setitem(sys.modules, "utils", utils_mod)
-    monkeypatch.setitem(sys.modules, "utils.paths", paths_mod)
-    sys.modules.pop("scripts.ledger_validate", None)
-    return importlib.import_module("scripts.ledger_validate")
+    paths_mod.proj_path = Path.cwd
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "utils", utils_mod)
+        mp.setitem(sys.modules, "utils.paths", paths_mod)
+        return importlib.import_module("scripts.ledger_validate")
 
 
-def test_validate_ledger_reports_schema_errors(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
-    ledger_path = tmp_path / "ledger.yml"
-    ledger_path.write_text("- item", encoding="utf-8")
+@pytest.fixture
+def ledger_validate(_ledger_validate_module, monkeypatch, tmp_path: Path):
+    """Return ``scripts.ledger_validate`` with ``proj_path`` rooted at ``tmp_path``."""
+    monkeypatch.setattr(_ledger_validate_module, "proj_path", lambda: tmp_path)
+    _ledger_validate_module._git_show.cache_clear()
+    _ledger_validate_module._UNFETCHABLE_COMMITS.clear()
+    return _ledger_validate_module
 
-    errors = ledger_validate.validate_ledger(ledger_path)
 
-    assert errors == [f"{ledger_path}: top-level document must be a mapping"]
+def _validate_payload(ledger_validate, monkeypatch, payload, path: Path) -> list[str]:
+    """Run ``validate_ledger`` against ``payload`` without a YAML file round-trip."""
+
+    def fake_load_yaml(candidate: Path):
+        assert candidate == path
+        return payload
 
+    monkeypatch.setattr(ledger_validate, "_load_yaml", fake_load_yaml)
+    return ledger_validate.validate_ledger(path)
 
-def test_validate_ledger_flags_invalid_headers(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+
+def test_validate_ledger_reports_schema_errors(
+    ledger_validate, tmp_path: Path, monkeypatch
+) -> None:
     ledger_path = tmp_path / "ledger.yml"
-    payload = {
-        "version": 2,
-        "issue": "nope",
-        "base": "",
-        "branch": "",
-        "tasks": [],
-    }
-    ledger_path.write_text(yaml.safe_dump(payload), encoding="utf-8")
 
-    errors = ledger_validate.validate_ledger(ledger_path)
+    errors = _validate_payload(ledger_validate, monkeypatch, ["item"], ledger_path)
 
-    assert f"{ledger_path}: version must be 1" in errors
-    assert f"{ledger_path}: issue must be an integer" in errors
-    assert f"{ledger_path}: base must be a non-empty string" in errors
-    assert f"{ledger_path}: branch must be a non-empty string" in errors
-    assert f"{ledger_path}: tasks must be a non-empty list" in errors
+    assert errors == [f"{ledger_path}: top-level document must be a mapping"]
 
 
-def test_validate_ledger_task_rules(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
-    ledger_path = tmp_path / "ledger.yml"
-    payload = {
-        "version": 1,
-        "issue": 123,
-        "base": "main",
-        "branch": "feature/test",
-        "tasks": [
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        pytest.param(
             {
-                "id": "task-1",
-                "title": "First",
-                "status": "doing",
-                "finished_at": "2024-01-01T00:00:00Z",
+                "version": 2,
+                "issue": "nope",
+                "base": "",
+                "branch": "",
+                "tasks": [],
             },
+            [
+                "{path}: version must be 1",
+                "{path}: issue must be an integer",
+                "{path}: base must be a non-empty string",
+                "{path}: branch must be a non-empty string",
+                "{path}: tasks must be a non-empty list",
+            ],
+            id="invalid-headers",
+        ),
+        pytest.param(
             {
-                "id": "task-2",
-                "title": "Second",
-                "status": "doing",
+                "version": 1,
+                "issue": 123,
+                "base": "main",
+                "branch": "feature/test",
+                "tasks": [
+                    {
+                        "id": "task-1",
+                        "title": "First",
+                        "status": "doing",
+                        "finished_at": "2024-01-01T00:00:00Z",
+                    },
+                    {
+                        "id": "task-2",
+                        "title": "Second",
+                        "status": "doing",
+                    },
+                    {
+                        "id": "task-3",
+                        "title": "Third",
+                        "status": "todo",
+                        "started_at": "2024-01-01T00:00:00Z",
+                    },
+                ],
             },
+            [
+                "tasks[0].finished_at must be null unless status is done",
+                "tasks[2].started_at must be null when status is todo",
+                "{path}: at most one task may have status=doing (found 2)",
+            ],
+            id="task-rules",
+        ),
+        pytest.param(
             {
-                "id": "task-3",
-                "title": "Third",
-                "status": "todo",
-                "started_at": "2024-01-01T00:00:00Z",
+                "version": 1,
+                "issue": 1,
+                "base": "main",
+                "branch": "feature",
+                "tasks": ["not-a-mapping"],
             },
-        ],
-    }
-    ledger_path.write_text(yaml.safe_dump(payload), encoding="utf-8")
+            ["{path}: tasks[0] must be a mapping"],
+            id="non-mapping-task",
+        ),
+    ],
+)
+def test_validate_ledger_reports_field_errors(
+    ledger_validate, tmp_path: Path, monkeypatch, payload, expected
+) -> None:
+    ledger_path = tmp_path / "ledger.yml"
 
-    errors = ledger_validate.validate_ledger(ledger_path)
+    errors = _validate_payload(ledger_validate, monkeypatch, payload, ledger_path)
 
-    assert "tasks[0].finished_at must be null unless status is done" in errors
-    assert "tasks[2].started_at must be null when status is todo" in errors
-    assert f"{ledger_path}: at most one task may have status=doing (found 2)" in errors
-
-
-def test_commit_validation_for_done_task(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
-    ledger_validate.REPO_ROOT = tmp_path
-    ledger_dir = tmp_path / ".agents"
-    ledger_dir.mkdir()
-    ledger_path = ledger_dir / "issue-1-ledger.yml"
-    payload = {
-        "version": 1,
-        "issue": 1,
-        "base": "main",
-        "branch": "feature/ledger",
-        "tasks": [
-            {
-                "id": "task-1",
-                "title": "Ship it",
-                "status": "done",
-                "commit": "abcdef1",
-            }
-        ],
-    }
-    ledger_path.write_text(yaml.safe_dump(payload), encoding="utf-8")
+    for message in expected:
+        assert message.format(path=ledger_path) in errors
+
+
+def test_commit_validation_for_done_task(
+    ledger_validate, tmp_path: Path, monkeypatch, agents_dir: Path
+) -> None:
+    monkeypatch.setattr(ledger_validate, "REPO_ROOT", tmp_path)
+    ledger_path = agents_dir / "issue-1-ledger.yml"
+    ledger_path.write_bytes(_DONE_TASK_LEDGER_YAML)
 
+    monkeypatch.setattr(ledger_validate, "_prefetch_commits", lambda commits: list(commits))
     monkeypatch.setattr(
         ledger_validate, "_commit_files", lambda commit: [".agents/issue-1-ledger.yml"]
     )
@@ -119,22 +190,18 @@ def test_commit_validation_for_done_task(tmp_path: Path, monkeypatch) -> None:
     assert f"{ledger_path}: tasks[0].commit abcdef1 must include non-ledger changes" in errors
 
 
-def test_find_ledgers_returns_expected_paths(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
-    ledger_dir = tmp_path / ".agents"
-    ledger_dir.mkdir()
-    ledger_path = ledger_dir / "issue-5-ledger.yml"
-    ledger_path.write_text("version: 1", encoding="utf-8")
+def test_find_ledgers_returns_expected_paths(ledger_validate, agents_dir: Path) -> None:
+    ledger_path = agents_dir / "issue-5-ledger.yml"
+    ledger_path.write_bytes(b"version: 1")
 
     ledgers = ledger_validate.find_ledgers([])
 
     assert ledgers == [ledger_path]
 
 
-def test_load_yaml_invalid_raises_ledger_error(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_load_yaml_invalid_raises_ledger_error(ledger_validate, tmp_path: Path) -> None:
     ledger_path = tmp_path / "ledger.yml"
-    ledger_path.write_text("foo: [", encoding="utf-8")
+    ledger_path.write_bytes(b"foo: [")
 
     with pytest.raises(ledger_validate.LedgerError) as excinfo:
         ledger_validate._load_yaml(ledger_path)
@@ -143,9 +210,7 @@ def test_load_yaml_invalid_raises_ledger_error(tmp_path: Path, monkeypatch) -> N
     assert excinfo.value.context == str(ledger_path)
 
 
-def test_validate_timestamp_formats_are_checked(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
-
+def test_validate_timestamp_formats_are_checked(ledger_validate) -> None:
     errors = ledger_validate._validate_timestamp(
         123,
         field="started_at",
@@ -161,9 +226,7 @@ def test_validate_timestamp_formats_are_checked(tmp_path: Path, monkeypatch) ->
     assert "tasks[1].finished_at is not a valid timestamp" in errors[0]
 
 
-def test_validate_timestamp_rejects_non_iso_format(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
-
+def test_validate_timestamp_rejects_non_iso_format(ledger_validate) -> None:
     errors = ledger_validate._validate_timestamp(
         "2024-01-01",
         field="started_at",
@@ -175,16 +238,12 @@ def test_validate_timestamp_rejects_non_iso_format(tmp_path: Path, monkeypatch)
     ]
 
 
-def test_ensure_type_allows_none(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
-
+def test_ensure_type_allows_none(ledger_validate) -> None:
     assert ledger_validate._ensure_type(None, str, allow_none=True) is True
     assert ledger_validate._ensure_type(123, str) is False
 
 
-def test_commit_files_raises_for_unknown_commit(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
-
+def test_commit_files_raises_for_unknown_commit(ledger_validate, monkeypatch) -> None:
     def raise_called_process_error(*args, **kwargs):
         raise subprocess.CalledProcessError(1, args[0])
 
@@ -195,8 +254,7 @@ def test_commit_files_raises_for_unknown_commit(tmp_path: Path, monkeypatch) ->
         ledger_validate._commit_files("deadbeef")
 
 
-def test_fetch_commit_succeeds_without_retry(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_fetch_commit_succeeds_without_retry(ledger_validate, monkeypatch) -> None:
     calls: list[list[str]] = []
 
     def fake_check_call(args, stdout=None, stderr=None):
@@ -218,8 +276,7 @@ def test_fetch_commit_succeeds_without_retry(tmp_path: Path, monkeypatch) -> Non
     ]
 
 
-def test_fetch_commit_retries_after_deepen(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_fetch_commit_retries_after_deepen(ledger_validate, monkeypatch) -> None:
     calls: list[list[str]] = []
 
     def fake_check_call(args, stdout=None, stderr=None):
@@ -235,8 +292,7 @@ def test_fetch_commit_retries_after_deepen(tmp_path: Path, monkeypatch) -> None:
     assert calls[-1][-1] == "abc1234"
 
 
-def test_fetch_commit_continues_after_failed_retry(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_fetch_commit_continues_after_failed_retry(ledger_validate, monkeypatch) -> None:
     calls: list[list[str]] = []
 
     def fake_check_call(args, stdout=None, stderr=None):
@@ -253,15 +309,74 @@ def test_fetch_commit_continues_after_failed_retry(tmp_path: Path, monkeypatch)
     assert calls[-1][-1] == "abc1234"
 
 
-def test_commit_files_fetches_history(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_fetch_commits_retries_individually_when_batch_fails(ledger_validate, monkeypatch) -> None:
+    calls: list[list[str]] = []
+
+    def fake_check_call(args, stdout=None, stderr=None):
+        calls.append(args[4:])
+        if "bad0000" in args or "--deepen" in args or "--unshallow" in args:
+            raise subprocess.CalledProcessError(1, args)
+        return 0
+
+    monkeypatch.setattr(ledger_validate.subprocess, "check_call", fake_check_call)
+
+    assert ledger_validate._fetch_commits(["abc1234", "bad0000", "def5678"]) is False
+    assert calls == [
+        ["origin", "abc1234", "bad0000", "def5678"],
+        ["origin", "abc1234"],
+        ["origin", "bad0000"],
+        ["origin", "def5678"],
+        ["--deepen", "256", "origin"],
+        ["--unshallow", "origin"],
+    ]
+
+    calls.clear()
+    assert ledger_validate._fetch_commit("bad0000") is False
+    assert ledger_validate._fetch_commit("abc1234") is True
+    assert calls == [["origin", "abc1234"]]
+
+
+def test_fetch_commits_records_only_failing_shas_after_deepen(ledger_validate, monkeypatch) -> None:
+    calls: list[list[str]] = []
+    deepened = False
+
+    def fake_check_call(args, stdout=None, stderr=None):
+        nonlocal deepened
+        calls.append(args[4:])
+        if "--deepen" in args:
+            deepened = True
+            return 0
+        # "abc1234" only becomes reachable once history is deepened.
+        if "bad0000" in args or ("abc1234" in args and not deepened):
+            raise subprocess.CalledProcessError(1, args)
+        return 0
+
+    monkeypatch.setattr(ledger_validate.subprocess, "check_call", fake_check_call)
+
+    assert ledger_validate._fetch_commits(["abc1234", "bad0000"]) is False
+    assert calls == [
+        ["origin", "abc1234", "bad0000"],
+        ["origin", "abc1234"],
+        ["origin", "bad0000"],
+        ["--deepen", "256", "origin"],
+        ["origin", "abc1234", "bad0000"],
+        ["origin", "abc1234"],
+        ["origin", "bad0000"],
+        ["--unshallow", "origin"],
+        ["origin", "bad0000"],
+    ]
+    unfetchable = ledger_validate._UNFETCHABLE_COMMITS
+    assert unfetchable == {"bad0000"}
+
+
+def test_commit_files_fetches_history(ledger_validate, monkeypatch) -> None:
     calls = {"count": 0}
 
-    def fake_check_output(args, text=True):
+    def fake_check_output(args):
         calls["count"] += 1
         if calls["count"] == 1:
             raise subprocess.CalledProcessError(1, args)
-        return "first.txt\nsecond.txt\n"
+        return b"first.txt\0second.txt\0"
 
     monkeypatch.setattr(ledger_validate.subprocess, "check_output", fake_check_output)
     monkeypatch.setattr(ledger_validate, "_fetch_commit", lambda commit: True)
@@ -269,15 +384,14 @@ def test_commit_files_fetches_history(tmp_path: Path, monkeypatch) -> None:
     assert ledger_validate._commit_files("abc1234") == ["first.txt", "second.txt"]
 
 
-def test_commit_subject_fetches_history(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_commit_subject_fetches_history(ledger_validate, monkeypatch) -> None:
     calls = {"count": 0}
 
-    def fake_check_output(args, text=True):
+    def fake_check_output(args):
         calls["count"] += 1
         if calls["count"] == 1:
             raise subprocess.CalledProcessError(1, args)
-        return "fix: subject"
+        return b"fix: subject"
 
     monkeypatch.setattr(ledger_validate.subprocess, "check_output", fake_check_output)
     monkeypatch.setattr(ledger_validate, "_fetch_commit", lambda commit: True)
@@ -285,9 +399,7 @@ def test_commit_subject_fetches_history(tmp_path: Path, monkeypatch) -> None:
     assert ledger_validate._commit_subject("abc1234") == "fix: subject"
 
 
-def test_commit_subject_raises_for_unknown_commit(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
-
+def test_commit_subject_raises_for_unknown_commit(ledger_validate, monkeypatch) -> None:
     def raise_called_process_error(*args, **kwargs):
         raise subprocess.CalledProcessError(1, args[0])
 
@@ -298,25 +410,7 @@ def test_commit_subject_raises_for_unknown_commit(tmp_path: Path, monkeypatch) -
         ledger_validate._commit_subject("deadbeef")
 
 
-def test_validate_ledger_rejects_non_mapping_task(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
-    ledger_path = tmp_path / "ledger.yml"
-    payload = {
-        "version": 1,
-        "issue": 1,
-        "base": "main",
-        "branch": "feature",
-        "tasks": ["not-a-mapping"],
-    }
-    ledger_path.write_text(yaml.safe_dump(payload), encoding="utf-8")
-
-    errors = ledger_validate.validate_ledger(ledger_path)
-
-    assert f"{ledger_path}: tasks[0] must be a mapping" in errors
-
-
-def test_validate_task_commit_rules(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_validate_task_commit_rules(ledger_validate, tmp_path: Path) -> None:
     ledger_path = tmp_path / "ledger.yml"
 
     task = {
@@ -332,8 +426,7 @@ def test_validate_task_commit_rules(tmp_path: Path, monkeypatch) -> None:
     assert not any("notes must be a list" in error for error in errors)
 
 
-def test_validate_task_invalid_fields(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_validate_task_invalid_fields(ledger_validate, tmp_path: Path) -> None:
     ledger_path = tmp_path / "ledger.yml"
 
     task = {
@@ -353,8 +446,7 @@ def test_validate_task_invalid_fields(tmp_path: Path, monkeypatch) -> None:
     assert "tasks[0].commit must be empty or a Git SHA" in errors
 
 
-def test_validate_task_done_requires_valid_commit(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_validate_task_done_requires_valid_commit(ledger_validate, tmp_path: Path) -> None:
     ledger_path = tmp_path / "ledger.yml"
 
     task = {
@@ -369,8 +461,7 @@ def test_validate_task_done_requires_valid_commit(tmp_path: Path, monkeypatch) -
     assert "tasks[0].commit must be a Git SHA (7-40 hex characters)" in errors
 
 
-def test_validate_task_commit_has_no_files(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_validate_task_commit_has_no_files(ledger_validate, tmp_path: Path, monkeypatch) -> None:
     ledger_path = tmp_path / "ledger.yml"
 
     monkeypatch.setattr(ledger_validate, "_commit_files", lambda commit: [])
@@ -387,8 +478,7 @@ def test_validate_task_commit_has_no_files(tmp_path: Path, monkeypatch) -> None:
     assert f"{ledger_path}: tasks[0].commit abcdef1 has no changed files" in errors
 
 
-def test_validate_task_commit_type_and_duplicate_ids(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_validate_task_commit_type_and_duplicate_ids(ledger_validate, tmp_path: Path) -> None:
     ledger_path = tmp_path / "ledger.yml"
     seen_ids: set[str] = set()
 
@@ -415,9 +505,8 @@ def test_validate_task_commit_type_and_duplicate_ids(tmp_path: Path, monkeypatch
     assert "duplicate task id: task-1" in errors
 
 
-def test_validate_task_handles_commit_errors(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
-    ledger_validate.REPO_ROOT = tmp_path
+def test_validate_task_handles_commit_errors(ledger_validate, tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(ledger_validate, "REPO_ROOT", tmp_path)
     ledger_path = tmp_path / "ledger.yml"
 
     def raise_commit_files(_commit):
@@ -437,12 +526,11 @@ def test_validate_task_handles_commit_errors(tmp_path: Path, monkeypatch) -> Non
     assert f"{ledger_path}: tasks[0].commit abcdef1 not found in repository" in errors[0]
 
 
-def test_validate_task_commit_subject_failure(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
-    ledger_validate.REPO_ROOT = tmp_path
-    ledger_dir = tmp_path / ".agents"
-    ledger_dir.mkdir()
-    ledger_path = ledger_dir / "issue-1-ledger.yml"
+def test_validate_task_commit_subject_failure(
+    ledger_validate, tmp_path: Path, monkeypatch, agents_dir: Path
+) -> None:
+    monkeypatch.setattr(ledger_validate, "REPO_ROOT", tmp_path)
+    ledger_path = agents_dir / "issue-1-ledger.yml"
 
     monkeypatch.setattr(
         ledger_validate, "_commit_files", lambda commit: [".agents/issue-1-ledger.yml"]
@@ -466,8 +554,9 @@ def test_validate_task_commit_subject_failure(tmp_path: Path, monkeypatch) -> No
     assert any("must include non-ledger changes" in error for error in errors)
 
 
-def test_validate_task_allows_non_agents_files(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_validate_task_allows_non_agents_files(
+    ledger_validate, tmp_path: Path, monkeypatch
+) -> None:
     ledger_path = tmp_path / "ledger.yml"
 
     monkeypatch.setattr(ledger_validate, "_commit_files", lambda commit: ["src/app.py"])
@@ -485,37 +574,21 @@ def test_validate_task_allows_non_agents_files(tmp_path: Path, monkeypatch) -> N
     assert errors == []
 
 
-def test_find_ledgers_respects_explicit_paths(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
-
+def test_find_ledgers_respects_explicit_paths(ledger_validate, tmp_path: Path) -> None:
     ledgers = ledger_validate.find_ledgers([str(tmp_path / "one.yml"), str(tmp_path / "two.yml")])
 
     assert ledgers == [tmp_path / "one.yml", tmp_path / "two.yml"]
 
 
-def test_find_ledgers_returns_empty_when_missing(tmp_path: Path, monkeypatch) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
-
+def test_find_ledgers_returns_empty_when_missing(ledger_validate) -> None:
     assert ledger_validate.find_ledgers([]) == []
 
 
-def test_main_reports_validated_ledgers(tmp_path: Path, monkeypatch, capsys) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_main_reports_validated_ledgers(
+    ledger_validate, tmp_path: Path, monkeypatch, capsys
+) -> None:
     ledger_path = tmp_path / "ledger.yml"
-    ledger_path.write_text(
-        yaml.safe_dump(
-            {
-                "version": 1,
-                "issue": 1,
-                "base": "main",
-                "branch": "feature",
-                "tasks": [
-                    {"id": "task-1", "title": "Ok", "status": "todo"},
-                ],
-            }
-        ),
-        encoding="utf-8",
-    )
+    ledger_path.write_bytes(_VALID_LEDGER_YAML)
 
     monkeypatch.setattr(ledger_validate, "find_ledgers", lambda paths: [ledger_path])
 
@@ -525,8 +598,7 @@ def test_main_reports_validated_ledgers(tmp_path: Path, monkeypatch, capsys) ->
     assert f"Validated {ledger_path}" in capsys.readouterr().out
 
 
-def test_main_reports_no_ledgers(tmp_path: Path, monkeypatch, capsys) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_main_reports_no_ledgers(ledger_validate, monkeypatch, capsys) -> None:
     monkeypatch.setattr(ledger_validate, "find_ledgers", lambda paths: [])
 
     exit_code = ledger_validate.main([])
@@ -535,23 +607,9 @@ def test_main_reports_no_ledgers(tmp_path: Path, monkeypatch, capsys) -> None:
     assert "No ledger files found." in capsys.readouterr().out
 
 
-def test_main_prints_errors_to_stderr(tmp_path: Path, monkeypatch, capsys) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_main_prints_errors_to_stderr(ledger_validate, tmp_path: Path, monkeypatch, capsys) -> None:
     ledger_path = tmp_path / "ledger.yml"
-    ledger_path.write_text(
-        yaml.safe_dump(
-            {
-                "version": 1,
-                "issue": "nope",
-                "base": "main",
-                "branch": "feature",
-                "tasks": [
-                    {"id": "task-1", "title": "Ok", "status": "todo"},
-                ],
-            }
-        ),
-        encoding="utf-8",
-    )
+    ledger_path.write_bytes(_BAD_ISSUE_LEDGER_YAML)
 
     monkeypatch.setattr(ledger_validate, "find_ledgers", lambda paths: [ledger_path])
 
@@ -561,27 +619,11 @@ def test_main_prints_errors_to_stderr(tmp_path: Path, monkeypatch, capsys) -> No
     assert "issue must be an integer" in capsys.readouterr().err
 
 
-def test_main_json_output_includes_errors(tmp_path: Path, monkeypatch, capsys) -> None:
-    ledger_validate = _load_module(monkeypatch, tmp_path)
+def test_main_json_output_includes_errors(
+    ledger_validate, tmp_path: Path, monkeypatch, capsys
+) -> None:
     ledger_path = tmp_path / "ledger.yml"
-    ledger_path.write_text(
-        yaml.safe_dump(
-            {
-                "version": 2,
-                "issue": 10,
-                "base": "main",
-                "branch": "feature/ledger",
-                "tasks": [
-                    {
-                        "id": "task-1",
-                        "title": "Example",
-                        "status": "todo",
-                    }
-                ],
-            }
-        ),
-        encoding="utf-8",
-    )
+    ledger_path.write_bytes(_VERSION_2_LEDGER_YAML)
 
     monkeypatch.setattr(ledger_validate, "find_ledgers", lambda paths: [ledger_path])
 
@@ -592,3 +634,130 @@ def test_main_json_output_includes_errors(tmp_path: Path, monkeypatch, capsys) -
     assert exit_code == 1
     assert str(ledger_path) in payload
     assert any("version must be 1" in msg for msg in payload[str(ledger_path)])
+
+
+def test_git_show_reuses_output_for_repeated_commit(ledger_validate, monkeypatch) -> None:
+    calls: list[list[str]] = []
+
+    def fake_check_output(args):
+        calls.append(args)
+        return b"src/app.py\0"
+
+    monkeypatch.setattr(ledger_validate.subprocess, "check_output", fake_check_output)
+
+    assert ledger_validate._commit_files("abc1234") == ["src/app.py"]
+    assert ledger_validate._commit_files("abc1234") == ["src/app.py"]
+    assert len(calls) == 1
+
+
+def test_prefetch_commits_fetches_only_missing(ledger_validate, monkeypatch) -> None:
+    fetched: list[list[str]] = []
+
+    runs: list[tuple[list[str], bytes]] = []
+
+    def fake_run(args, input=None, capture_output=False, check=False):
+        runs.append((args, input))
+        stdout = (
+            b"abc1234000000000000000000000000000000000 commit 210\n"
+            b"def5678^{commit} missing\n"
+            b"fedcba9^{commit} missing\n"
+        )
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr=b"")
+
+    monkeypatch.setattr(ledger_validate.subprocess, "run", fake_run)
+    monkeypatch.setattr(ledger_validate, "_fetch_commits", fetched.append)
+
+    ledger_validate._prefetch_commits(["abc1234", "def5678", "def5678", "fedcba9"])
+
+    assert runs == [
+        (
+            ["git", "cat-file", "--batch-check"],
+            b"abc1234^{commit}\ndef5678^{commit}\nfedcba9^{commit}\n",
+        )
+    ]
+    assert fetched == [["def5678", "fedcba9"]]
+
+
+def test_missing_commits_skips_non_sha_entries(ledger_validate, monkeypatch) -> None:
+    requests: list[bytes] = []
+
+    def fake_run(args, input=None, capture_output=False, check=False):
+        requests.append(input)
+        stdout = b"abc1234000000000000000000000000000000000 commit 210\n"
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr=b"")
+
+    monkeypatch.setattr(ledger_validate.subprocess, "run", fake_run)
+
+    assert ledger_validate._missing_commits(["abc1234", "abc\ndef", "not a sha"]) == []
+    assert requests == [b"abc1234^{commit}\n"]
+
+
+def test_missing_commits_treats_short_reply_as_all_missing(ledger_validate, monkeypatch) -> None:
+    def fake_run(args, input=None, capture_output=False, check=False):
+        stdout = b"abc1234000000000000000000000000000000000 commit 210\n"
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr=b"")
+
+    monkeypatch.setattr(ledger_validate.subprocess, "run", fake_run)
+
+    assert ledger_validate._missing_commits(["abc1234", "def5678"]) == ["abc1234", "def5678"]
+
+
+def test_prefetch_commits_skips_fetch_when_all_present(ledger_validate, monkeypatch) -> None:
+    def fake_run(args, input=None, capture_output=False, check=False):
+        stdout = b"".join(
+            line.split(b"^")[0].ljust(40, b"0") + b" commit 210\n" for line in input.splitlines()
+        )
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr=b"")
+
+    def fail_fetch(commits):
+        raise AssertionError(f"unexpected fetch of {commits}")
+
+    monkeypatch.setattr(ledger_validate.subprocess, "run", fake_run)
+    monkeypatch.setattr(ledger_validate, "_fetch_commits", fail_fetch)
+
+    ledger_validate._prefetch_commits(["abc1234", "def5678"])
+
+
+def test_find_ledgers_matches_glob_semantics(ledger_validate, agents_dir: Path) -> None:
+    for name in ("issue-2-ledger.yml", "issue--ledger.yml", "issue-ledger.yml", "notes.yml"):
+        (agents_dir / name).touch()
+    (agents_dir / "issue-3-ledger.yml").mkdir()
+
+    ledgers = ledger_validate.find_ledgers([])
+
+    assert ledgers == [agents_dir / "issue--ledger.yml", agents_dir / "issue-2-ledger.yml"]
+
+
+def test_main_reports_each_ledger_in_order(
+    ledger_validate, tmp_path: Path, monkeypatch, capsys
+) -> None:
+    first = tmp_path / "first.yml"
+    second = tmp_path / "second.yml"
+    first.write_bytes(_VALID_LEDGER_YAML)
+    second.write_bytes(_VALID_LEDGER_YAML)
+
+    monkeypatch.setattr(ledger_validate, "find_ledgers", lambda paths: [second, first])
+
+    exit_code = ledger_validate.main([])
+
+    assert exit_code == 0
+    assert capsys.readouterr().out.splitlines() == [f"Validated {second}", f"Validated {first}"]
+
+
+def test_validate_task_skips_subject_when_files_already_fail(
+    ledger_validate, tmp_path: Path, monkeypatch, agents_dir: Path
+) -> None:
+    monkeypatch.setattr(ledger_validate, "REPO_ROOT", tmp_path)
+    ledger_path = agents_dir / "issue-1-ledger.yml"
+
+    def fail_subject(_commit):
+        raise AssertionError("subject lookup should be skipped")
+
+    monkeypatch.setattr(ledger_validate, "_commit_files", lambda commit: [".agents/notes.md"])
+    monkeypatch.setattr(ledger_validate, "_commit_subject", fail_subject)
+
+    task = {"id": "task-1", "title": "Ship it", "status": "done", "commit": "abcdef1"}
+
+    errors = ledger_validate._validate_task(task, index=0, seen_ids=set(), ledger_path=ledger_path)
+
+    assert errors == [f"{ledger_path}: tasks[0].commit abcdef1 must include non-ledger changes"]
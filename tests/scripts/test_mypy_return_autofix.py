@@ -1,10 +1,14 @@
 import ast
+import functools
 import textwrap
 from pathlib import Path
 
+import pytest
+
 from scripts import mypy_return_autofix
 
 
+@functools.cache
 def _expr(source: str) -> ast.AST:
     return ast.parse(source).body[0].value
 
@@ -46,54 +50,54 @@ def test_collect_string_vars_tracks_assignments() -> None:
     assert list_vars == {"names", "nums"}
 
 
-def test_process_function_updates_list_annotation() -> None:
-    source = textwrap.dedent(
-        """\
-        def names() -> list[int]:
-            items = ["a"]
-            return items
-        """
-    )
-    module = ast.parse(source)
-    lines = source.splitlines()
-    func = module.body[0]
-
-    changed = mypy_return_autofix._process_function(func, lines, set())
-
-    assert changed is True
-    assert "list[str]" in lines[0]
-
-
-def test_process_function_no_annotation_no_change() -> None:
-    source = textwrap.dedent(
-        """\
-        def value():
-            return "hi"
-        """
-    )
-    module = ast.parse(source)
-    lines = source.splitlines()
+_PROCESS_FUNCTION_SOURCES = {
+    "list_annotation": """\
+def names() -> list[int]:
+    items = ["a"]
+    return items
+""",
+    "no_annotation": """\
+def value():
+    return "hi"
+""",
+    "bare_return": """\
+def value() -> int:
+    return
+""",
+}
+
+
+@pytest.fixture(scope="module")
+def parsed_functions() -> dict[str, tuple[ast.Module, list[str]]]:
+    return {
+        label: (ast.parse(source), source.splitlines())
+        for label, source in _PROCESS_FUNCTION_SOURCES.items()
+    }
+
+
+@pytest.mark.parametrize(
+    ("label", "expect_changed", "expect_first_line"),
+    [
+        ("list_annotation", True, "def names() -> list[str]:"),
+        ("no_annotation", False, "def value():"),
+        ("bare_return", False, "def value() -> int:"),
+    ],
+)
+def test_process_function(
+    parsed_functions: dict[str, tuple[ast.Module, list[str]]],
+    label: str,
+    expect_changed: bool,
+    expect_first_line: str,
+) -> None:
+    module, source_lines = parsed_functions[label]
+    # _process_function edits lines in place, so keep the shared copy pristine.
+    lines = list(source_lines)
     func = module.body[0]
 
     changed = mypy_return_autofix._process_function(func, lines, set())
 
-    assert changed is False
-
-
-def test_process_function_skips_bare_return() -> None:
-    source = textwrap.dedent(
-        """\
-        def value() -> int:
-            return
-        """
-    )
-    module = ast.parse(source)
-    lines = source.splitlines()
-    func = module.body[0]
-
-    changed = mypy_return_autofix._process_function(func, lines, set())
-
-    assert changed is False
+    assert changed is expect_changed
+    assert lines[0] == expect_first_line
 
 
 def test_process_file_rewrites_annotation(tmp_path: Path) -> None:
@@ -112,6 +116,14 @@ def test_process_file_rewrites_annotation(tmp_path: Path) -> None:
     assert "-> str:" in path.read_text(encoding="utf-8")
 
 
+def test_process_file_skips_files_without_annotations(tmp_path: Path) -> None:
+    path = tmp_path / "plain.py"
+    # Not valid Python: the file must be skipped before it reaches ast.parse.
+    path.write_text("def value(:\n    return 'hello'\n", encoding="utf-8")
+
+    assert mypy_return_autofix._process_file(path) is False
+
+
 def test_annotation_to_str_without_unparse(monkeypatch) -> None:
     monkeypatch.delattr(ast, "unparse", raising=False)
 
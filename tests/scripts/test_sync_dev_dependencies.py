@@ -88,6 +88,35 @@ def test_sync_lockfile_preserves_comments_and_whitespace(tmp_path: Path) -> None
     assert "black==2.0.0" in updated
 
 
+def test_sync_lockfile_keeps_blank_lines_and_check_mode(tmp_path: Path) -> None:
+    lockfile = tmp_path / "requirements.lock"
+    original = "ruff==0.1.0\n\n\nblack==0.2.0"
+    lockfile.write_text(original, encoding="utf-8")
+    pins = {"RUFF_VERSION": "1.0.0", "BLACK_VERSION": "2.0.0"}
+
+    changes, _ = sdd.sync_lockfile(lockfile, pins, apply=False)
+
+    assert len(changes) == 2
+    assert lockfile.read_text(encoding="utf-8") == original
+
+    sdd.sync_lockfile(lockfile, pins, apply=True)
+
+    assert lockfile.read_text(encoding="utf-8") == "ruff==1.0.0\n\n\nblack==2.0.0"
+
+
+def test_update_dependencies_in_section_rewrites_all_pins_in_one_pass() -> None:
+    section = '  "pytest>=7.0",\n  "pytest-cov>=4.0",\n  "Ruff==0.1.0",\n  "mypy",'
+
+    new_section, updated = sdd.update_dependencies_in_section(
+        section, {"pytest": "8.0.0", "pytest-cov": "5.0.0", "ruff": "1.0.0"}
+    )
+
+    assert updated == {"pytest", "pytest-cov", "ruff"}
+    assert new_section == (
+        '  "pytest==8.0.0",\n  "pytest-cov==5.0.0",\n  "Ruff==1.0.0",\n  "mypy",'
+    )
+
+
 def test_main_apply_updates_pyproject_and_lockfile(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import base64
+import json
 import runpy
+import subprocess
 import sys
+import urllib.error
+import urllib.request
+from email.message import Message
 from pathlib import Path
 
 import pytest
@@ -81,15 +86,10 @@ def test_print_check_report_no_present(capsys: pytest.CaptureFixture[str]) -> No
     assert "Missing" in captured.out
 
 
-def test_load_template_gitignore_falls_back(monkeypatch: pytest.MonkeyPatch) -> None:
-    original_exists = Path.exists
-
-    def fake_exists(self: Path) -> bool:
-        if self.name == ".gitignore" and "templates/consumer-repo" in str(self):
-            return False
-        return original_exists(self)
-
-    monkeypatch.setattr(Path, "exists", fake_exists)
+def test_load_template_gitignore_falls_back(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(sync_status_file_ignores, "TEMPLATE_GITIGNORE", tmp_path / ".gitignore")
 
     content = sync_status_file_ignores.load_template_gitignore()
 
@@ -179,19 +179,32 @@ def test_main_check_local_missing_gitignore(
     assert "No .gitignore found" in captured.err
 
 
+class _FakeResponse:
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    def __enter__(self) -> _FakeResponse:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def read(self) -> bytes:
+        return self._body
+
+
 def test_main_repo_success(
     capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
 ) -> None:
     encoded = base64.b64encode(_full_gitignore_content().encode("utf-8")).decode("utf-8")
+    requests: list[urllib.request.Request] = []
 
-    class DummyResult:
-        returncode = 0
-        stdout = encoded
-        stderr = ""
-
-    import subprocess
+    def fake_urlopen(request: urllib.request.Request, timeout: float) -> _FakeResponse:
+        requests.append(request)
+        return _FakeResponse(json.dumps({"content": encoded}).encode("utf-8"))
 
-    monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: DummyResult())
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setenv("GH_TOKEN", "secret")
     monkeypatch.setattr(sys, "argv", ["script", "--repo", "owner/repo"])
 
     exit_code = sync_status_file_ignores.main()
@@ -199,19 +212,18 @@ def test_main_repo_success(
     captured = capsys.readouterr()
     assert exit_code == 0
     assert "All canonical patterns present" in captured.out
+    assert requests[0].full_url == "https://api.github.com/repos/owner/repo/contents/.gitignore"
+    assert requests[0].get_header("Authorization") == "Bearer secret"
 
 
 def test_main_repo_error(
     capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    class DummyResult:
-        returncode = 1
-        stdout = ""
-        stderr = "boom"
+    def fake_urlopen(request: urllib.request.Request, timeout: float) -> _FakeResponse:
+        raise urllib.error.URLError("boom")
 
-    import subprocess
-
-    monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: DummyResult())
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setenv("GH_TOKEN", "secret")
     monkeypatch.setattr(sys, "argv", ["script", "--repo", "owner/repo"])
 
     exit_code = sync_status_file_ignores.main()
@@ -222,6 +234,70 @@ def test_main_repo_error(
     assert "boom" in captured.err
 
 
+def test_main_repo_reports_missing_or_private_repo(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fake_urlopen(request: urllib.request.Request, timeout: float) -> _FakeResponse:
+        raise urllib.error.HTTPError(request.full_url, 404, "Not Found", Message(), None)
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setenv("GITHUB_TOKEN", "secret")
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.setattr(sys, "argv", ["script", "--repo", "owner/private"])
+
+    exit_code = sync_status_file_ignores.main()
+
+    captured = capsys.readouterr()
+    assert exit_code == 1
+    assert "Error fetching .gitignore from owner/private" in captured.err
+    assert "404" in captured.err
+
+
+def test_main_repo_without_token_uses_gh_credentials(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    encoded = base64.b64encode(_full_gitignore_content().encode("utf-8")).decode("utf-8")
+    calls: list[list[str]] = []
+
+    def fake_run(args: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout=f"{encoded}\n", stderr="")
+
+    def fail_urlopen(*args: object, **kwargs: object) -> None:
+        raise AssertionError("urlopen must not be used without a token")
+
+    for name in ("GH_TOKEN", "GITHUB_TOKEN"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(urllib.request, "urlopen", fail_urlopen)
+    monkeypatch.setattr(sys, "argv", ["script", "--repo", "owner/private"])
+
+    exit_code = sync_status_file_ignores.main()
+
+    assert exit_code == 0
+    assert "All canonical patterns present" in capsys.readouterr().out
+    assert calls == [["gh", "api", "repos/owner/private/contents/.gitignore", "--jq", ".content"]]
+
+
+def test_main_repo_without_token_reports_gh_failure(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fake_run(args: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        return subprocess.CompletedProcess(args, 1, stdout="", stderr="HTTP 404: Not Found")
+
+    for name in ("GH_TOKEN", "GITHUB_TOKEN"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(sys, "argv", ["script", "--repo", "owner/private"])
+
+    exit_code = sync_status_file_ignores.main()
+
+    captured = capsys.readouterr()
+    assert exit_code == 1
+    assert "Error fetching .gitignore from owner/private" in captured.err
+    assert "HTTP 404: Not Found" in captured.err
+
+
 def test_main_default_print_help(
     capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -71,6 +71,20 @@ def test_extract_imports_from_file_handles_parse_errors(tmp_path: Path) -> None:
     assert std.extract_imports_from_file(sample) == set()
 
 
+def test_extract_imports_from_file_includes_nested_imports(tmp_path: Path) -> None:
+    sample = tmp_path / "nested.py"
+    sample.write_text(
+        "try:\n    import yaml\nexcept ImportError:\n    yaml = None\n\n"
+        "def load():\n    from pkg.sub import thing\n    return thing\n",
+        encoding="utf-8",
+    )
+    plain = tmp_path / "plain.py"
+    plain.write_text("VALUE = 1\n", encoding="utf-8")
+
+    assert std.extract_imports_from_file(sample) == {"yaml", "pkg"}
+    assert std.extract_imports_from_file(plain) == set()
+
+
 def test_get_all_test_imports_returns_empty_without_tests_dir(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -96,6 +110,19 @@ def test_get_all_test_imports_scans_tests_dir(
     assert imports == {"os", "requests", "yaml"}
 
 
+def test_get_all_test_imports_uses_thread_pool_for_large_suites(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tests_dir = tmp_path / "tests"
+    (tests_dir / "nested").mkdir(parents=True)
+    (tests_dir / "test_one.py").write_text("import os\n", encoding="utf-8")
+    (tests_dir / "nested" / "test_two.py").write_text("import yaml\n", encoding="utf-8")
+    monkeypatch.setattr(std, "PARALLEL_SCAN_THRESHOLD", 0)
+    monkeypatch.chdir(tmp_path)
+
+    assert std.get_all_test_imports() == {"os", "yaml"}
+
+
 def test_get_declared_dependencies_skips_missing_pyproject(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
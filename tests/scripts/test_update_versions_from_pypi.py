@@ -145,6 +145,32 @@ class TestUpdateEnvFile:
 class TestGetLatestPyPIVersion:
     """Tests for PyPI API queries."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_lookup_cache(self) -> None:
+        update_versions_from_pypi._query_latest_pypi_version.cache_clear()
+
+    @staticmethod
+    def _response(version: str) -> MagicMock:
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps({"info": {"version": version}}).encode()
+        mock_response.__enter__ = MagicMock(return_value=mock_response)
+        mock_response.__exit__ = MagicMock(return_value=False)
+        return mock_response
+
+    def test_repeat_lookups_reuse_result(self) -> None:
+        with patch("urllib.request.urlopen", return_value=self._response("2.0.0")) as urlopen:
+            assert get_latest_pypi_version("cached-package") == "2.0.0"
+            assert get_latest_pypi_version("cached-package") == "2.0.0"
+
+        assert urlopen.call_count == 1
+
+    def test_failed_lookup_is_retried(self) -> None:
+        with patch("urllib.request.urlopen", side_effect=TimeoutError("timeout")):
+            assert get_latest_pypi_version("flaky-package") is None
+
+        with patch("urllib.request.urlopen", return_value=self._response("3.0.0")):
+            assert get_latest_pypi_version("flaky-package") == "3.0.0"
+
     def test_successful_fetch(self) -> None:
         """Mock a successful PyPI response."""
         mock_response = MagicMock()
@@ -203,6 +229,22 @@ class TestCheckVersions:
 
         assert results["RUFF_VERSION"].is_outdated is False
 
+    def test_matches_concurrent_lookups_to_their_keys(self, tmp_path: Path) -> None:
+        env_file = tmp_path / "test.env"
+        env_file.write_text("RUFF_VERSION=0.1.0\nBLACK_VERSION=24.1.0\nMYPY_VERSION=1.0\n")
+        latest = {"ruff": "0.2.0", "black": "24.1.0", "mypy": None}
+
+        with patch.object(
+            update_versions_from_pypi,
+            "get_latest_pypi_version",
+            side_effect=latest.get,
+        ):
+            results = check_versions(env_file)
+
+        assert list(results) == ["BLACK_VERSION", "RUFF_VERSION"]
+        assert results["RUFF_VERSION"] == VersionInfo("0.1.0", "0.2.0", True)
+        assert results["BLACK_VERSION"] == VersionInfo("24.1.0", "24.1.0", False)
+
 
 class TestMain:
     """Tests for the main CLI function."""
@@ -27,21 +27,6 @@ def _write_sample_junit(tmp_path: Path) -> Path:
     return junit_path
 
 
-def test_tag_name_strips_namespace() -> None:
-    element = ET.Element("{urn:test}failure")
-    assert ci_metrics._tag_name(element) == "failure"
-
-
-def test_build_nodeid_handles_missing_components() -> None:
-    assert ci_metrics._build_nodeid("", "") == "(unknown)"
-    assert ci_metrics._build_nodeid("pkg.module", "") == "pkg.module"
-
-
-def test_parse_float_negative_value_raises() -> None:
-    with pytest.raises(SystemExit, match="MIN_SECONDS must be non-negative"):
-        ci_metrics._parse_float("-1.5", "MIN_SECONDS", 0.0)
-
-
 def test_collect_slow_tests_empty_inputs() -> None:
     assert ci_metrics._collect_slow_tests([], top_n=5, min_seconds=0.5) == []
 